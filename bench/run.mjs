@@ -0,0 +1,265 @@
+// Headless benchmarks for the game and AI engines.
+//
+//   node bench/run.mjs                     run, compare against baseline.json
+//   node bench/run.mjs --update-baseline   run and store as the new baseline
+//   node bench/run.mjs --filter ai.hard    only benchmarks whose name matches
+//   node bench/run.mjs --threshold 0.5     allowed slowdown before failing
+//   node bench/run.mjs --samples 25        timed samples per benchmark per round
+//   node bench/run.mjs --rounds 5          passes over the whole suite
+//   node bench/run.mjs --profile           also write a .cpuprofile per bench
+//
+// Results go to bench/results.json. Every benchmark runs in its own child
+// process, so JIT type feedback from one bench (say, checkWinner on 3x3
+// lines) can't change how another is compiled. Each is warmed up for a
+// fixed time, then timed in batches. The suite runs several interleaved
+// rounds so that a slow stretch on the machine can't hit only one
+// benchmark. The gate compares the fastest sample of the best round:
+// interference from other processes and the hypervisor only ever adds
+// time, so the minimum is the most repeatable figure. Each minimum is also
+// divided by a fixed reference loop timed just before it, so a machine
+// clocked lower for a whole run doesn't read as a regression. The process
+// exits 1 if any benchmark is slower than its baseline by more than its
+// threshold, or if a search visits more nodes than it did in the baseline.
+// Node counts are deterministic, so they catch search regressions that
+// timing noise would hide.
+import { readFileSync, writeFileSync, existsSync } from 'node:fs';
+import { execFileSync } from 'node:child_process';
+import { fileURLToPath } from 'node:url';
+import { Session } from 'node:inspector/promises';
+import os from 'node:os';
+import {
+  createBoard, checkWinner, getAvailableMoves, getWinPatterns,
+} from '../js/gameEngine.js';
+import {
+  getAIMove, searchBestMove, preloadMoveTable,
+} from '../js/aiEngine.js';
+import { searchMove, clearTranspositionTables } from '../js/mnkEngine.js';
+
+const dir = (name) => fileURLToPath(new URL(name, import.meta.url));
+const BASELINE = dir('./baseline.json');
+const RESULTS = dir('./results.json');
+
+const args = process.argv.slice(2);
+const flag = (name) => args.includes(name);
+const option = (name, fallback) => {
+  const i = args.indexOf(name);
+  return i >= 0 ? args[i + 1] : fallback;
+};
+const threshold = Number(option('--threshold', '0.4'));
+const filter = option('--filter', '');
+const child = option('--child', null);
+const SAMPLES = Number(option('--samples', '10'));
+const ROUNDS = Number(option('--rounds', '5'));
+const SAMPLE_MS = 30;
+const WARMUP_MS = 200;
+
+// Easy and Medium roll dice; a fixed stream keeps their work comparable
+// between runs.
+function seedRandom(seed) {
+  let x = seed >>> 0;
+  Math.random = () => {
+    x ^= x << 13; x ^= x >>> 17; x ^= x << 5;
+    return (x >>> 0) / 4294967296;
+  };
+}
+
+function boardFrom(rows) {
+  return rows.join('').split('').map(c => (c === '.' ? null : c));
+}
+
+const CLASSIC = {
+  empty: createBoard(),
+  opening: boardFrom(['X..', '.O.', '...']),
+  midgame: boardFrom(['XO.', '.X.', '..O']),
+  full: boardFrom(['XOX', 'XOO', 'OXX']),
+};
+const LARGE_7 = boardFrom([
+  '.......', '..O....', '..XX...', '...XO..', '....O..', '.......', '.......',
+]);
+const PATTERNS_7 = getWinPatterns(7, 5);
+
+// Sub-microsecond calls still swing by up to ~70% between runs on shared
+// hardware, so they only fail when they get twice as slow.
+function micro(fn) {
+  return { fn, threshold: 1 };
+}
+
+// Fixed-depth searches from a cleared table; `stats` collects node counts.
+// Their timing is allocation-heavy and noisy, so they are gated on the
+// deterministic node count alone and their times are informational.
+function mnkBench(board, size, k, player, maxDepth) {
+  const stats = {};
+  return {
+    threshold: Infinity,
+    fn() {
+      clearTranspositionTables();
+      searchMove(board, size, k, player, { timeMs: Infinity, maxDepth, stats });
+    },
+    nodes: () => stats.nodes,
+  };
+}
+
+// Every position below has X to move (equal piece counts).
+const benches = [
+  ['engine.checkWinner.classic', micro(() => {
+    for (const board of Object.values(CLASSIC)) checkWinner(board);
+  })],
+  ['engine.checkWinner.7x7', micro(() => checkWinner(LARGE_7, PATTERNS_7))],
+  ['engine.getAvailableMoves.classic', micro(() => {
+    for (const board of Object.values(CLASSIC)) getAvailableMoves(board);
+  })],
+  ['engine.getAvailableMoves.7x7', micro(() => getAvailableMoves(LARGE_7))],
+  ['ai.easy.classic', micro(() => getAIMove(CLASSIC.midgame.slice(), 'X', 'easy'))],
+  ['ai.medium.classic', micro(() => getAIMove(CLASSIC.opening.slice(), 'X', 'medium'))],
+  ['ai.hard.classic.empty', micro(() => getAIMove(CLASSIC.empty.slice(), 'X', 'hard'))],
+  ['ai.hard.classic.midgame', micro(() => getAIMove(CLASSIC.midgame.slice(), 'X', 'hard'))],
+  ['minimax.classic.empty', () => searchBestMove(CLASSIC.empty.slice(), 'X')],
+  ['minimax.classic.opening', () => searchBestMove(CLASSIC.opening.slice(), 'X')],
+  ['mnk.4x4.depth4', mnkBench(createBoard(16), 4, 4, 'X', 4)],
+  ['mnk.7x7.depth3', mnkBench(LARGE_7, 7, 5, 'X', 3)],
+]
+  .map(([name, bench]) => ({ name, ...(typeof bench === 'function' ? { fn: bench } : bench) }))
+  .filter(({ name }) => (child ? name === child : name.includes(filter)));
+
+function now() {
+  return Number(process.hrtime.bigint()) / 1e6;
+}
+
+// Pure integer work with no allocation: its speed tracks the machine, not
+// the code under test.
+function reference() {
+  let x = 1;
+  let sum = 0;
+  for (let i = 0; i < 20000; i++) {
+    x ^= x << 13; x ^= x >>> 17; x ^= x << 5;
+    sum += x & 255;
+  }
+  return sum;
+}
+
+function warmUp(fn) {
+  const end = now() + WARMUP_MS;
+  while (now() < end) fn();
+}
+
+function measure(fn, samples = SAMPLES) {
+  // Size batches so each sample runs ~SAMPLE_MS, which keeps timer noise
+  // small for sub-microsecond functions and gives millisecond-scale
+  // searches several iterations per sample.
+  let iterations = 1;
+  for (;;) {
+    const start = now();
+    for (let i = 0; i < iterations; i++) fn();
+    if (now() - start >= SAMPLE_MS || iterations >= 1 << 24) break;
+    iterations *= 2;
+  }
+  const perOp = [];
+  for (let s = 0; s < samples; s++) {
+    const start = now();
+    for (let i = 0; i < iterations; i++) fn();
+    perOp.push(((now() - start) * 1e6) / iterations);
+  }
+  perOp.sort((a, b) => a - b);
+  const round = (ns) => Math.round(ns * 10) / 10;
+  const median = perOp[Math.floor(perOp.length / 2)];
+  return {
+    iterations,
+    minNs: round(perOp[0]),
+    medianNs: round(median),
+    p95Ns: round(perOp[Math.min(perOp.length - 1, Math.floor(perOp.length * 0.95))]),
+    opsPerSec: Math.round(1e9 / median),
+  };
+}
+
+async function profile(name, fn) {
+  const session = new Session();
+  session.connect();
+  await session.post('Profiler.enable');
+  await session.post('Profiler.start');
+  const end = now() + 500;
+  while (now() < end) fn();
+  const { profile: data } = await session.post('Profiler.stop');
+  session.disconnect();
+  const out = dir(`./${name}.cpuprofile`);
+  writeFileSync(out, JSON.stringify(data));
+  return out;
+}
+
+// Child mode: time the one named benchmark and print its result as JSON.
+if (child) {
+  const [{ name, fn, nodes }] = benches;
+  await preloadMoveTable();
+  seedRandom(0x2545f491);
+  const refNs = measure(reference).minNs;
+  warmUp(fn);
+  const result = measure(fn);
+  result.relative = Math.round((result.minNs / refNs) * 1e6) / 1e6;
+  if (nodes) result.nodes = nodes();
+  if (flag('--profile')) result.profile = await profile(name, fn);
+  process.stdout.write(JSON.stringify(result));
+  process.exit(0);
+}
+
+function runChild(name, withProfile) {
+  const childArgs = [fileURLToPath(import.meta.url), '--child', name, '--samples', String(SAMPLES)];
+  if (withProfile) childArgs.push('--profile');
+  const out = execFileSync(process.execPath, childArgs, { encoding: 'utf8', stdio: ['ignore', 'pipe', 'inherit'] });
+  return JSON.parse(out);
+}
+
+const results = {};
+for (let round = 0; round < ROUNDS; round++) {
+  for (const { name } of benches) {
+    const result = runChild(name, false);
+    const best = results[name];
+    if (!best || result.relative < best.relative) results[name] = result;
+  }
+}
+
+for (const { name, nodes } of benches) {
+  const { minNs, opsPerSec } = results[name];
+  const work = nodes ? `  ${results[name].nodes} nodes` : '';
+  console.log(`${name.padEnd(34)} ${minNs.toFixed(1).padStart(14)} ns/op ${String(opsPerSec).padStart(12)} ops/s${work}`);
+  if (flag('--profile')) console.log(`  profile: ${runChild(name, true).profile}`);
+}
+
+const report = {
+  date: new Date().toISOString(),
+  node: process.version,
+  platform: `${os.platform()}-${os.arch()}`,
+  cpu: os.cpus()[0]?.model ?? 'unknown',
+  results,
+};
+writeFileSync(RESULTS, JSON.stringify(report, null, 2) + '\n');
+
+if (flag('--update-baseline')) {
+  writeFileSync(BASELINE, JSON.stringify(report, null, 2) + '\n');
+  console.log(`baseline updated: ${BASELINE}`);
+  process.exit(0);
+}
+
+if (!existsSync(BASELINE)) {
+  console.log('no baseline.json; run with --update-baseline to create one');
+  process.exit(0);
+}
+
+const baseline = JSON.parse(readFileSync(BASELINE, 'utf8'));
+let regressions = 0;
+console.log(`\ncompared with baseline from ${baseline.date} (${baseline.cpu}), default threshold ${threshold * 100}%`);
+for (const [name, result] of Object.entries(results)) {
+  const before = baseline.results[name];
+  if (!before) {
+    console.log(`  ${name}: new, no baseline`);
+    continue;
+  }
+  const limit = Math.max(threshold, benches.find(b => b.name === name).threshold ?? 0);
+  const change = result.relative / before.relative - 1;
+  const moreNodes = result.nodes !== undefined && before.nodes !== undefined
+    && result.nodes > before.nodes;
+  const regressed = change > limit || moreNodes;
+  if (regressed) regressions++;
+  const sign = change >= 0 ? '+' : '';
+  const work = moreNodes ? `, nodes ${before.nodes} -> ${result.nodes}` : '';
+  console.log(`  ${regressed ? 'REGRESSION' : 'ok        '} ${name.padEnd(34)} ${sign}${(change * 100).toFixed(1)}%${work}`);
+}
+process.exit(regressions > 0 ? 1 : 0);
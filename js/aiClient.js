@@ -0,0 +1,64 @@
+// Main-thread side of the AI worker. A search in progress can't be
+// interrupted by a message, so cancelling terminates the worker outright and
+// a fresh one is started for the next request.
+let worker = null;
+let nextId = 0;
+let pending = null;
+
+function spawn() {
+  try {
+    worker = new Worker(new URL('./aiWorker.js', import.meta.url), { type: 'module' });
+  } catch {
+    worker = null;
+    return;
+  }
+  worker.addEventListener('message', ({ data }) => {
+    if (!pending || data.id !== pending.id) return;
+    const { resolve } = pending;
+    pending = null;
+    resolve(data.move);
+  });
+  worker.addEventListener('error', () => {
+    // Module workers are unavailable or failed to load; finish on the main
+    // thread rather than leave the game stuck on the AI's turn.
+    const request = pending;
+    pending = null;
+    worker.terminate();
+    worker = null;
+    if (request) searchInline(request).then(request.resolve);
+  });
+}
+
+async function searchInline({ board, aiPlayer, difficulty, variant }) {
+  const { getAIMove } = await import('./aiEngine.js');
+  return getAIMove(board, aiPlayer, difficulty, variant);
+}
+
+export function warmUpAI() {
+  if (!worker && typeof Worker !== 'undefined') spawn();
+}
+
+export function requestAIMove(board, aiPlayer, difficulty, variant) {
+  cancelAIMove();
+  const message = { id: ++nextId, board: board.slice(), aiPlayer, difficulty, variant };
+  return new Promise(resolve => {
+    warmUpAI();
+    if (!worker) {
+      searchInline(message).then(resolve);
+      return;
+    }
+    pending = { ...message, resolve };
+    worker.postMessage(message);
+  });
+}
+
+// Resolves any outstanding request with null so callers can tell a
+// cancelled search from a real move.
+export function cancelAIMove() {
+  if (!pending) return;
+  const { resolve } = pending;
+  pending = null;
+  worker.terminate();
+  worker = null;
+  resolve(null);
+}
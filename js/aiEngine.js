@@ -1,4 +1,66 @@
-import { getAvailableMoves, checkWinner, isBoardFull, opponent } from './gameEngine.js';
+import {
+  getAvailableMoves, checkWinner, isBoardFull, opponent, encodeBoard,
+  getWinPatterns, VARIANTS,
+} from './gameEngine.js';
+import { searchMove } from './mnkEngine.js';
+
+// Perfect-play table generated by scripts/buildMoveTable.mjs. Loaded on
+// demand so it never blocks first paint; until it arrives (or if it fails
+// to load) moves fall back to live minimax.
+const NO_ENTRY = -128;
+let packedTable = null;
+let moveScores = null;
+let tableRequest = null;
+
+export function setMoveTable(packed) {
+  packedTable = packed;
+  moveScores = null;
+}
+
+export function preloadMoveTable() {
+  if (!tableRequest) {
+    tableRequest = import('./moveTable.js')
+      .then(mod => { if (!packedTable) setMoveTable(mod.MOVE_TABLE); })
+      .catch(() => { /* live search only */ });
+  }
+  return tableRequest;
+}
+
+function decodeTable(packed) {
+  const scores = new Int8Array(19683 * 9).fill(NO_ENTRY);
+  let pos = 0;
+  while (pos < packed.length) {
+    const code = parseInt(packed.slice(pos, pos + 3), 36);
+    pos += 3;
+    let rest = code;
+    for (let i = 0; i < 9; i++) {
+      if (rest % 3 === 0) scores[code * 9 + i] = packed.charCodeAt(pos++) - 107;
+      rest = Math.floor(rest / 3);
+    }
+  }
+  return scores;
+}
+
+export function lookupBestMove(board) {
+  if (!moveScores) {
+    if (!packedTable) {
+      preloadMoveTable();
+      return null;
+    }
+    moveScores = decodeTable(packedTable);
+  }
+  const base = encodeBoard(board) * 9;
+  let bestScore = NO_ENTRY;
+  let bestMove = null;
+  for (let i = 0; i < 9; i++) {
+    const score = moveScores[base + i];
+    if (score > bestScore) {
+      bestScore = score;
+      bestMove = i;
+    }
+  }
+  return bestMove;
+}
 
 function minimax(board, depth, isMaximizing, alpha, beta, aiPlayer) {
   const humanPlayer = opponent(aiPlayer);
@@ -34,7 +96,17 @@ function minimax(board, depth, isMaximizing, alpha, beta, aiPlayer) {
   }
 }
 
-function getBestMove(board, aiPlayer) {
+export function scoreMoves(board, aiPlayer) {
+  const scores = Array(9).fill(null);
+  for (const move of getAvailableMoves(board)) {
+    board[move] = aiPlayer;
+    scores[move] = minimax(board, 0, false, -Infinity, Infinity, aiPlayer);
+    board[move] = null;
+  }
+  return scores;
+}
+
+export function searchBestMove(board, aiPlayer) {
   const moves = getAvailableMoves(board);
   let bestScore = -Infinity;
   let bestMove = moves[0];
@@ -51,31 +123,62 @@ function getBestMove(board, aiPlayer) {
   return bestMove;
 }
 
+function getBestMove(board, aiPlayer) {
+  const move = lookupBestMove(board);
+  return move !== null ? move : searchBestMove(board, aiPlayer);
+}
+
 function getRandomMove(board) {
   const moves = getAvailableMoves(board);
   return moves[Math.floor(Math.random() * moves.length)];
 }
 
-function getBlockingOrWinningMove(board, player) {
+function getBlockingOrWinningMove(board, player, patterns) {
   const moves = getAvailableMoves(board);
   const opp = opponent(player);
 
   for (const move of moves) {
     board[move] = player;
-    if (checkWinner(board)) { board[move] = null; return move; }
+    if (checkWinner(board, patterns)) { board[move] = null; return move; }
     board[move] = null;
   }
   for (const move of moves) {
     board[move] = opp;
-    if (checkWinner(board)) { board[move] = null; return move; }
+    if (checkWinner(board, patterns)) { board[move] = null; return move; }
     board[move] = null;
   }
   return null;
 }
 
-export function getAIMove(board, aiPlayer, difficulty) {
+// Larger boards can't be searched to the end, so difficulty maps to how
+// long the bitboard engine may think and how often it plays loosely.
+function getMnkMove(board, aiPlayer, difficulty, { size, k }) {
+  const patterns = getWinPatterns(size, k);
+
+  switch (difficulty) {
+    case 'easy': {
+      const tactical = getBlockingOrWinningMove(board, aiPlayer, patterns);
+      if (tactical !== null && Math.random() < 0.3) return tactical;
+      return getRandomMove(board);
+    }
+
+    case 'medium': {
+      const tactical = getBlockingOrWinningMove(board, aiPlayer, patterns);
+      if (tactical !== null) return tactical;
+      if (Math.random() < 0.6) return searchMove(board, size, k, aiPlayer, { timeMs: 150, maxDepth: 3 });
+      return getRandomMove(board);
+    }
+
+    case 'hard':
+    default:
+      return searchMove(board, size, k, aiPlayer, { timeMs: 800 });
+  }
+}
+
+export function getAIMove(board, aiPlayer, difficulty, variant = 'classic') {
   const moves = getAvailableMoves(board);
   if (moves.length === 0) return null;
+  if (variant !== 'classic') return getMnkMove(board, aiPlayer, difficulty, VARIANTS[variant]);
 
   switch (difficulty) {
     case 'easy': {
@@ -0,0 +1,11 @@
+// Runs AI move search off the main thread so rendering and GSAP tweens keep
+// their frame budget while the engine thinks.
+import { getAIMove, preloadMoveTable } from './aiEngine.js';
+
+preloadMoveTable();
+
+self.addEventListener('message', ({ data }) => {
+  const { id, board, aiPlayer, difficulty, variant } = data;
+  const move = getAIMove(board, aiPlayer, difficulty, variant);
+  self.postMessage({ id, move });
+});
@@ -1,21 +1,24 @@
 import { createInitialState, reduce } from './gameState.js';
-import { WIN_PATTERNS } from './gameEngine.js';
+import { VARIANTS } from './gameEngine.js';
 import {
   animatePiecePlacement, animateWinLine, animateWinCells,
   animateScreenShake, animateModalIn, animateModalOut,
   animateBoardClear, animateBoardIn, animateScorePop, pulseStreakIcon,
 } from './animations.js';
 import { initCircuitBackground } from './circuitBg.js';
+import { requestAIMove, cancelAIMove, warmUpAI } from './aiClient.js';
 
 let state = createInitialState('X', 'medium');
 let aiMoveQueued = false;
+let aiRequestToken = 0;
+let resetting = false;
 
 // ── DOM refs ──
 const $ = (s, p) => (p || document).querySelector(s);
 const $$ = (s, p) => [...(p || document).querySelectorAll(s)];
 
 const boardEl = $('#board');
-const cells = $$('.cell', boardEl);
+let cells = $$('.cell', boardEl);
 const turnText = $('#turn-text');
 const scoreEls = {
   human: $('#score-human'),
@@ -29,42 +32,77 @@ const modal = $('#result-modal');
 const resultBadge = $('#result-badge-piece');
 const resultTitle = $('#result-title');
 const resultSubtitle = $('#result-subtitle');
+const scoreCards = $$('.score-card');
 const winLineContainer = $('#win-line-container');
 const boardWrapper = $('#board-wrapper');
 
 // Segmented controls
 const markerBtns = $$('[data-marker]');
 const diffBtns = $$('[data-diff]');
+const variantBtns = $$('[data-variant]');
 const markerSlider = $('#marker-slider');
 const diffSlider = $('#diff-slider');
+const variantSlider = $('#variant-slider');
+
+function boardSize() {
+  return VARIANTS[state.variant].size;
+}
+
+// Rebuild the grid when the variant changes the number of cells.
+function buildBoard() {
+  const size = boardSize();
+  cells.forEach(cell => cell.remove());
+  cells = Array.from({ length: size * size }, (_, i) => {
+    const cell = document.createElement('div');
+    cell.className = 'cell';
+    cell.setAttribute('role', 'gridcell');
+    cell.tabIndex = 0;
+    cell.setAttribute('aria-label', `Cell ${i + 1}: empty`);
+    return cell;
+  });
+  boardEl.dataset.size = size;
+  boardEl.style.setProperty('--grid-size', size);
+  boardEl.prepend(...cells);
+}
 
 // ── Render helpers ──
-function renderBoard() {
+// Each helper compares against `prev`, the state last drawn, and only
+// touches the DOM for slices that changed. `prev` is null for a full draw.
+function renderBoard(prev) {
+  if (cells.length !== state.board.length) {
+    buildBoard();
+    prev = null;
+  }
+  const phaseChanged = !prev || prev.phase !== state.phase;
+  if (!phaseChanged && prev.board === state.board) return;
+
+  const over = state.phase !== 'playing';
+  let placed = false;
   cells.forEach((cell, i) => {
     const val = state.board[i];
+    if (!phaseChanged && prev.board[i] === val) return;
     cell.classList.toggle('occupied', val !== null);
-    cell.classList.toggle('game-over', state.phase !== 'playing');
+    cell.classList.toggle('game-over', over);
     cell.setAttribute('aria-label',
       val ? `Cell ${i + 1}: ${val}` : `Cell ${i + 1}: empty`);
-    cell.setAttribute('aria-disabled', val !== null || state.phase !== 'playing' ? 'true' : 'false');
+    cell.setAttribute('aria-disabled', val !== null || over ? 'true' : 'false');
 
     const existing = cell.querySelector('.piece');
     if (val && !existing) {
       const piece = document.createElement('div');
       piece.className = `piece piece-${val.toLowerCase()}`;
       cell.appendChild(piece);
-      if (i === state.lastPlacedIndex) {
-        animatePiecePlacement(cell);
-        tryHaptic(10);
-      }
+      animatePiecePlacement(cell);
+      placed = true;
     } else if (!val && existing) {
       existing.remove();
     }
   });
+  if (placed) tryHaptic(10);
 }
 
-function renderScores() {
-  const prev = { ...scoreEls };
+function renderScores(prev) {
+  if (prev && prev.scores === state.scores && prev.streak === state.streak) return;
   Object.entries(scoreEls).forEach(([key, el]) => {
     const val = state.scores[key];
     if (el.textContent !== String(val)) {
@@ -74,12 +112,11 @@ function renderScores() {
   });
 
   // Leading indicator
-  const cards = $$('.score-card');
-  cards.forEach(c => c.classList.remove('leading'));
+  scoreCards.forEach(c => c.classList.remove('leading'));
   if (state.scores.human > state.scores.ai) {
-    cards[0].classList.add('leading');
+    scoreCards[0].classList.add('leading');
   } else if (state.scores.ai > state.scores.human) {
-    cards[2].classList.add('leading');
+    scoreCards[2].classList.add('leading');
   }
 
   // Streak — hide entirely when zero
@@ -94,7 +131,9 @@ function renderScores() {
   }
 }
 
-function renderTurn() {
+function renderTurn(prev) {
+  if (prev && prev.phase === state.phase && prev.currentTurn === state.currentTurn
+    && prev.humanMarker === state.humanMarker) return;
   if (state.phase !== 'playing') {
     turnText.textContent = '';
     return;
@@ -103,49 +142,96 @@ function renderTurn() {
     ? 'YOUR TURN' : 'AI THINKING';
 }
 
-function renderSegmented() {
-  markerBtns.forEach((btn, i) => {
-    const active = btn.dataset.marker === state.humanMarker;
+// Button widths come from a ResizeObserver so rendering never forces a
+// synchronous layout. Until the first observation arrives the slider is
+// left alone; the observer schedules a render when it does.
+const segWidths = new Map();
+let segmentsDirty = true;
+
+function renderSegment(btns, slider, isActive) {
+  let activeIdx = 0;
+  btns.forEach((btn, i) => {
+    const active = isActive(btn);
+    if (active) activeIdx = i;
     btn.setAttribute('aria-pressed', active);
   });
-  const markerIdx = state.humanMarker === 'X' ? 0 : 1;
-  const markerBtnW = markerBtns[0].offsetWidth;
-  markerSlider.style.width = markerBtnW + 'px';
-  markerSlider.style.transform = `translateX(${markerIdx * markerBtnW}px)`;
+  const btnW = segWidths.get(btns[0]);
+  if (btnW === undefined) return;
+  slider.style.width = btnW + 'px';
+  slider.style.transform = `translateX(${activeIdx * btnW}px)`;
+}
 
-  diffBtns.forEach(btn => {
-    const active = btn.dataset.diff === state.difficulty;
-    btn.setAttribute('aria-pressed', active);
-  });
-  const diffIdx = ['easy', 'medium', 'hard'].indexOf(state.difficulty);
-  const diffBtnW = diffBtns[0].offsetWidth;
-  diffSlider.style.width = diffBtnW + 'px';
-  diffSlider.style.transform = `translateX(${diffIdx * diffBtnW}px)`;
+function renderSegmented(prev) {
+  if (!segmentsDirty && prev && prev.humanMarker === state.humanMarker
+    && prev.difficulty === state.difficulty && prev.variant === state.variant) return;
+  segmentsDirty = false;
+  renderSegment(markerBtns, markerSlider, btn => btn.dataset.marker === state.humanMarker);
+  renderSegment(diffBtns, diffSlider, btn => btn.dataset.diff === state.difficulty);
+  renderSegment(variantBtns, variantSlider, btn => btn.dataset.variant === state.variant);
 }
 
-function render() {
-  renderBoard();
-  renderScores();
-  renderTurn();
-  renderSegmented();
-  if (!state.winLine) {
+function render(prev) {
+  renderBoard(prev);
+  renderScores(prev);
+  renderTurn(prev);
+  renderSegmented(prev);
+  if (!state.winLine && (!prev || prev.winLine)) {
     winLineContainer.innerHTML = '';
   }
 }
 
+// ── Render scheduling ──
+// dispatch() only marks the frame dirty; DOM writes happen once per
+// animation frame against whatever state is current by then.
+let drawnState = null;
+let renderQueued = false;
+
+function flushRender() {
+  renderQueued = false;
+  if (drawnState === state && !segmentsDirty) return;
+  const prev = drawnState;
+  drawnState = state;
+  render(prev);
+}
+
+function scheduleRender() {
+  if (renderQueued) return;
+  renderQueued = true;
+  requestAnimationFrame(flushRender);
+}
+
+if (typeof ResizeObserver !== 'undefined') {
+  const segObserver = new ResizeObserver(entries => {
+    for (const entry of entries) {
+      const box = entry.borderBoxSize?.[0];
+      segWidths.set(entry.target, box ? box.inlineSize : entry.target.offsetWidth);
+    }
+    segmentsDirty = true;
+    scheduleRender();
+  });
+  [markerBtns[0], diffBtns[0], variantBtns[0]].forEach(btn => segObserver.observe(btn));
+} else {
+  [markerBtns[0], diffBtns[0], variantBtns[0]].forEach(btn => segWidths.set(btn, btn.offsetWidth));
+}
+
 // ── Dispatch ──
 function dispatch(action) {
   state = reduce(state, action);
-  render();
+  scheduleRender();
   handlePhase();
 }
 
 function handlePhase() {
   if (state.phase === 'playing' && state.currentTurn === state.aiMarker && !aiMoveQueued) {
     aiMoveQueued = true;
-    requestAnimationFrame(() => {
-      dispatch({ type: 'AI_MOVE' });
+    const token = ++aiRequestToken;
+    const requestedFor = state;
+    requestAIMove(state.board, state.aiMarker, state.difficulty, state.variant).then(move => {
+      // Only the latest request owns the queued flag; a result for a
+      // position that has since been reset is dropped.
+      if (token !== aiRequestToken) return;
       aiMoveQueued = false;
+      if (move !== null && state === requestedFor) dispatch({ type: 'AI_MOVE', index: move });
     });
   }
 
@@ -196,9 +282,8 @@ function showResult() {
 // ── Win line geometry ──
 function drawWinLine(pattern) {
   winLineContainer.innerHTML = '';
-  const [a, , c] = pattern;
-  const cellA = cells[a];
-  const cellC = cells[c];
+  const cellA = cells[pattern[0]];
+  const cellC = cells[pattern[pattern.length - 1]];
   const ref = winLineContainer.getBoundingClientRect();
   const rA = cellA.getBoundingClientRect();
   const rC = cellC.getBoundingClientRect();
@@ -222,7 +307,16 @@ function drawWinLine(pattern) {
 }
 
 // ── New game ──
+function cancelAI() {
+  cancelAIMove();
+  aiRequestToken++;
+  aiMoveQueued = false;
+}
+
 async function startNewGame() {
+  if (resetting) return;
+  resetting = true;
+  cancelAI();
   if (overlay.style.visibility === 'visible') {
     await animateModalOut(overlay);
   }
@@ -236,6 +330,8 @@ async function startNewGame() {
     cell.style.opacity = '';
     cell.style.transform = '';
   });
+  cancelAI();
+  resetting = false;
   dispatch({ type: 'NEW_GAME' });
   await animateBoardIn(cells);
 }
@@ -250,46 +346,60 @@ function delay(ms) {
 }
 
 // ── Event binding ──
-cells.forEach((cell, i) => {
-  cell.addEventListener('click', () => {
-    if (state.currentTurn === state.humanMarker && state.phase === 'playing') {
+// Delegated from the board so cells rebuilt for a new variant need no wiring.
+boardEl.addEventListener('click', (e) => {
+  const i = cells.indexOf(e.target.closest('.cell'));
+  if (i < 0) return;
+  if (!resetting && state.currentTurn === state.humanMarker && state.phase === 'playing') {
+    dispatch({ type: 'HUMAN_MOVE', index: i });
+  }
+});
+
+boardEl.addEventListener('keydown', (e) => {
+  const i = cells.indexOf(e.target.closest('.cell'));
+  if (i < 0) return;
+  if (e.key === 'Enter' || e.key === ' ') {
+    e.preventDefault();
+    if (!resetting && state.currentTurn === state.humanMarker && state.phase === 'playing') {
       dispatch({ type: 'HUMAN_MOVE', index: i });
     }
-  });
-  cell.addEventListener('keydown', (e) => {
-    if (e.key === 'Enter' || e.key === ' ') {
-      e.preventDefault();
-      if (state.currentTurn === state.humanMarker && state.phase === 'playing') {
-        dispatch({ type: 'HUMAN_MOVE', index: i });
-      }
-    }
-    // Arrow key navigation
-    let target = null;
-    const row = Math.floor(i / 3);
-    const col = i % 3;
-    if (e.key === 'ArrowRight' && col < 2) target = i + 1;
-    if (e.key === 'ArrowLeft' && col > 0) target = i - 1;
-    if (e.key === 'ArrowDown' && row < 2) target = i + 3;
-    if (e.key === 'ArrowUp' && row > 0) target = i - 3;
-    if (target !== null) {
-      e.preventDefault();
-      cells[target].focus();
-    }
-  });
+  }
+  // Arrow key navigation
+  let target = null;
+  const size = boardSize();
+  const row = Math.floor(i / size);
+  const col = i % size;
+  if (e.key === 'ArrowRight' && col < size - 1) target = i + 1;
+  if (e.key === 'ArrowLeft' && col > 0) target = i - 1;
+  if (e.key === 'ArrowDown' && row < size - 1) target = i + size;
+  if (e.key === 'ArrowUp' && row > 0) target = i - size;
+  if (target !== null) {
+    e.preventDefault();
+    cells[target].focus();
+  }
 });
 
 markerBtns.forEach(btn => {
   btn.addEventListener('click', () => {
+    cancelAI();
     dispatch({ type: 'SET_MARKER', marker: btn.dataset.marker });
   });
 });
 
 diffBtns.forEach(btn => {
   btn.addEventListener('click', () => {
+    cancelAI();
     dispatch({ type: 'SET_DIFFICULTY', difficulty: btn.dataset.diff });
   });
 });
 
+variantBtns.forEach(btn => {
+  btn.addEventListener('click', () => {
+    cancelAI();
+    dispatch({ type: 'SET_VARIANT', variant: btn.dataset.variant });
+  });
+});
+
 $('#btn-new-game').addEventListener('click', startNewGame);
 $('#btn-play-again').addEventListener('click', startNewGame);
 $('#btn-change-diff').addEventListener('click', async () => {
@@ -298,5 +408,6 @@ $('#btn-change-diff').addEventListener('click', async () => {
 
 // ── Init ──
 initCircuitBackground();
-render();
+warmUpAI();
+flushRender();
 handlePhase();
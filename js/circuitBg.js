@@ -1,10 +1,28 @@
+// Viewports are snapped up to a bucket so small resizes (mobile URL bars,
+// rotation back and forth) reuse an already-built SVG instead of
+// regenerating it.
+const SIZE_BUCKET = 160;
+const CACHE_LIMIT = 3;
+
+// Frame-time monitor: short bursts of sampled frames with a pause between
+// them. Quality drops after consecutive slow bursts and only climbs back
+// after a longer run of fast ones, so it doesn't flap at the boundary.
+const SAMPLE_FRAMES = 60;
+const SAMPLE_PAUSE_MS = 2000;
+const SLOW_FRAME_MS = 22;
+const FAST_FRAME_MS = 18;
+const SLOW_BURSTS_TO_DROP = 2;
+const FAST_BURSTS_TO_RAISE = 5;
+const QUALITY_LEVELS = ['full', 'reduced', 'static'];
+
 export function initCircuitBackground() {
   const container = document.querySelector('.circuit-bg');
   if (!container) return;
 
-  function generate() {
-    const W = window.innerWidth;
-    const H = window.innerHeight;
+  const cache = new Map();
+  let currentKey = null;
+
+  function generate(W, H) {
     const cx = W / 2;
     const cy = H / 2;
 
@@ -88,7 +106,8 @@ export function initCircuitBackground() {
     }
     nodes.push([cx, cy]);
 
-    let svg = `<svg viewBox="0 0 ${W} ${H}" xmlns="http://www.w3.org/2000/svg" style="width:100%;height:100%">
+    const svg = [];
+    svg.push(`<svg viewBox="0 0 ${W} ${H}" xmlns="http://www.w3.org/2000/svg" preserveAspectRatio="xMidYMid slice" style="width:100%;height:100%">
       <defs>
         <filter id="glow"><feGaussianBlur stdDeviation="3" result="b"/><feMerge><feMergeNode in="b"/><feMergeNode in="SourceGraphic"/></feMerge></filter>
         <filter id="node-bloom"><feGaussianBlur stdDeviation="4" result="b"/><feMerge><feMergeNode in="b"/><feMergeNode in="SourceGraphic"/></feMerge></filter>
@@ -97,46 +116,119 @@ export function initCircuitBackground() {
         </pattern>
       </defs>
       <rect width="100%" height="100%" fill="url(#dot-grid)"/>
-      <g stroke="#1E293B" stroke-width="1" fill="none" stroke-linecap="round" stroke-linejoin="round">`;
+      <g stroke="#1E293B" stroke-width="1" fill="none" stroke-linecap="round" stroke-linejoin="round">`);
 
     for (const d of allPaths) {
-      svg += `<path d="${d}"/>`;
+      svg.push(`<path d="${d}"/>`);
     }
-    svg += `</g>`;
+    svg.push(`</g>`);
 
-    svg += `<g stroke="#1A2332" stroke-width="0.5" fill="none" stroke-linecap="round" stroke-linejoin="round" opacity="0.6">`;
+    svg.push(`<g stroke="#1A2332" stroke-width="0.5" fill="none" stroke-linecap="round" stroke-linejoin="round" opacity="0.6">`);
     for (const d of allPaths) {
-      svg += `<path d="${d}" stroke-dasharray="2 6"/>`;
+      svg.push(`<path d="${d}" stroke-dasharray="2 6"/>`);
     }
-    svg += `</g>`;
+    svg.push(`</g>`);
 
-    svg += `<g filter="url(#glow)" fill="none" stroke-linecap="round" stroke-linejoin="round">`;
+    svg.push(`<g filter="url(#glow)" fill="none" stroke-linecap="round" stroke-linejoin="round">`);
     const animatedCount = Math.min(allPaths.length, glowClasses.length);
     for (let i = 0; i < animatedCount; i++) {
       const stroke = i % 2 === 0 ? '#38BDF8' : '#7DD3FC';
       const sw = i < 8 ? 1.5 : 1;
-      svg += `<path class="${glowClasses[i]}" stroke="${stroke}" stroke-width="${sw}" d="${allPaths[i]}"/>`;
+      const cls = i < 8 ? glowClasses[i] : `${glowClasses[i]} trace-extra`;
+      svg.push(`<path class="${cls}" stroke="${stroke}" stroke-width="${sw}" d="${allPaths[i]}"/>`);
     }
-    svg += `</g>`;
+    svg.push(`</g>`);
 
-    svg += `<g filter="url(#node-bloom)">`;
+    svg.push(`<g filter="url(#node-bloom)">`);
     for (let i = 0; i < nodes.length; i++) {
       const [nx, ny] = nodes[i];
       const r = i === nodes.length - 1 ? 3 : 1.5 + Math.random() * 1.5;
       const fill = i % 2 === 0 ? '#38BDF8' : '#7DD3FC';
       const delay = -(i * 0.7 % 8).toFixed(1);
-      svg += `<circle class="node-glow" cx="${nx}" cy="${ny}" r="${r}" fill="${fill}" style="animation-delay:${delay}s"/>`;
+      svg.push(`<circle class="node-glow" cx="${nx}" cy="${ny}" r="${r}" fill="${fill}" style="animation-delay:${delay}s"/>`);
+    }
+    svg.push(`</g></svg>`);
+
+    const tpl = document.createElement('template');
+    tpl.innerHTML = svg.join('');
+    return tpl.content.firstElementChild;
+  }
+
+  function update() {
+    const W = Math.ceil(window.innerWidth / SIZE_BUCKET) * SIZE_BUCKET;
+    const H = Math.ceil(window.innerHeight / SIZE_BUCKET) * SIZE_BUCKET;
+    const key = `${W}x${H}`;
+    if (key === currentKey) return;
+    currentKey = key;
+    // Map order doubles as recency: re-insert on use, evict the oldest.
+    const svg = cache.get(key) ?? generate(W, H);
+    cache.delete(key);
+    cache.set(key, svg);
+    if (cache.size > CACHE_LIMIT) cache.delete(cache.keys().next().value);
+    container.replaceChildren(svg);
+  }
+
+  // Steps the background down (no blur and fewer traces, then no
+  // animation) while frames run long, and back up once they recover.
+  function watchFrameTime() {
+    let level = 0;
+    let slowBursts = 0;
+    let fastBursts = 0;
+
+    function setLevel(next) {
+      level = next;
+      container.dataset.quality = QUALITY_LEVELS[level];
+      slowBursts = fastBursts = 0;
+    }
+
+    function judge(avg) {
+      if (avg > SLOW_FRAME_MS) {
+        fastBursts = 0;
+        if (++slowBursts >= SLOW_BURSTS_TO_DROP && level < QUALITY_LEVELS.length - 1) {
+          setLevel(level + 1);
+        }
+      } else if (avg < FAST_FRAME_MS) {
+        slowBursts = 0;
+        if (++fastBursts >= FAST_BURSTS_TO_RAISE && level > 0) setLevel(level - 1);
+      } else {
+        slowBursts = fastBursts = 0;
+      }
+    }
+
+    function burst() {
+      let last = 0;
+      let total = 0;
+      let frames = 0;
+      function tick(t) {
+        // Long gaps are a hidden tab or a paused page, not slow rendering.
+        if (last && t - last < 250) {
+          total += t - last;
+          frames++;
+        }
+        last = t;
+        if (frames < SAMPLE_FRAMES) {
+          requestAnimationFrame(tick);
+          return;
+        }
+        judge(total / frames);
+        setTimeout(burst, SAMPLE_PAUSE_MS);
+      }
+      requestAnimationFrame(tick);
     }
-    svg += `</g></svg>`;
 
-    container.innerHTML = svg;
+    // Startup work (worker spawn, fonts, intro tweens) would read as a slow
+    // device, so the first burst waits for the page to go idle.
+    const start = () => setTimeout(burst, SAMPLE_PAUSE_MS);
+    if ('requestIdleCallback' in window) requestIdleCallback(start, { timeout: 5000 });
+    else window.addEventListener('load', start, { once: true });
   }
 
-  generate();
+  update();
+  watchFrameTime();
 
   let resizeTimer;
   window.addEventListener('resize', () => {
     clearTimeout(resizeTimer);
-    resizeTimer = setTimeout(generate, 300);
+    resizeTimer = setTimeout(update, 300);
   });
 }
@@ -4,8 +4,40 @@ const WIN_PATTERNS = [
   [0, 4, 8], [2, 4, 6],
 ];
 
-export function createBoard() {
-  return Array(9).fill(null);
+const VARIANTS = {
+  classic: { size: 3, k: 3 },
+  '4x4': { size: 4, k: 4 },
+  '5x5': { size: 5, k: 4 },
+  '7x7': { size: 7, k: 5 },
+};
+
+const patternCache = new Map();
+
+export function getWinPatterns(size = 3, k = size) {
+  if (size === 3 && k === 3) return WIN_PATTERNS;
+  const key = `${size}:${k}`;
+  let patterns = patternCache.get(key);
+  if (!patterns) {
+    patterns = [];
+    for (const [dr, dc] of [[0, 1], [1, 0], [1, 1], [1, -1]]) {
+      for (let r = 0; r < size; r++) {
+        for (let c = 0; c < size; c++) {
+          const endR = r + dr * (k - 1);
+          const endC = c + dc * (k - 1);
+          if (endR >= size || endC < 0 || endC >= size) continue;
+          const line = [];
+          for (let i = 0; i < k; i++) line.push((r + dr * i) * size + c + dc * i);
+          patterns.push(line);
+        }
+      }
+    }
+    patternCache.set(key, patterns);
+  }
+  return patterns;
+}
+
+export function createBoard(cells = 9) {
+  return Array(cells).fill(null);
 }
 
 export function getAvailableMoves(board) {
@@ -22,12 +54,13 @@ export function applyMove(board, index, player) {
   return next;
 }
 
-export function checkWinner(board) {
-  for (const pattern of WIN_PATTERNS) {
-    const [a, b, c] = pattern;
-    if (board[a] && board[a] === board[b] && board[a] === board[c]) {
-      return { winner: board[a], line: pattern };
-    }
+export function checkWinner(board, patterns = WIN_PATTERNS) {
+  for (const pattern of patterns) {
+    const first = board[pattern[0]];
+    if (!first) continue;
+    let i = 1;
+    while (i < pattern.length && board[pattern[i]] === first) i++;
+    if (i === pattern.length) return { winner: first, line: pattern };
   }
   return null;
 }
@@ -36,15 +69,23 @@ export function isBoardFull(board) {
   return board.every(cell => cell !== null);
 }
 
-export function getGameResult(board) {
-  const win = checkWinner(board);
+export function getGameResult(board, patterns = WIN_PATTERNS) {
+  const win = checkWinner(board, patterns);
   if (win) return { status: 'win', winner: win.winner, line: win.line };
   if (isBoardFull(board)) return { status: 'draw', winner: null, line: null };
   return { status: 'playing', winner: null, line: null };
 }
 
+export function encodeBoard(board) {
+  let code = 0;
+  for (let i = 8; i >= 0; i--) {
+    code = code * 3 + (board[i] === 'X' ? 1 : board[i] === 'O' ? 2 : 0);
+  }
+  return code;
+}
+
 export function opponent(player) {
   return player === 'X' ? 'O' : 'X';
 }
 
-export { WIN_PATTERNS };
+export { WIN_PATTERNS, VARIANTS };
@@ -1,5 +1,6 @@
-import { createBoard, applyMove, getGameResult, opponent } from './gameEngine.js';
-import { getAIMove } from './aiEngine.js';
+import {
+  createBoard, applyMove, getGameResult, getWinPatterns, opponent, VARIANTS,
+} from './gameEngine.js';
 
 const STORAGE_KEY = 'tictactoe_state';
 
@@ -28,20 +29,30 @@ function persist(state) {
   } catch { /* ignore */ }
 }
 
-export function createInitialState(humanMarker = 'X', difficulty = 'medium') {
+function emptyBoard(variant) {
+  const { size } = VARIANTS[variant];
+  return createBoard(size * size);
+}
+
+function resultOf(board, variant) {
+  const { size, k } = VARIANTS[variant];
+  return getGameResult(board, getWinPatterns(size, k));
+}
+
+export function createInitialState(humanMarker = 'X', difficulty = 'medium', variant = 'classic') {
   const persisted = loadPersisted();
   return {
-    board: createBoard(),
+    board: emptyBoard(variant),
     humanMarker,
     aiMarker: opponent(humanMarker),
     difficulty,
+    variant,
     currentTurn: 'X',
     phase: 'playing',
     winLine: null,
     scores: persisted.scores,
     streak: persisted.streak,
     bestStreak: persisted.bestStreak,
-    lastPlacedIndex: null,
   };
 }
 
@@ -53,7 +64,7 @@ export function reduce(state, action) {
       const newBoard = applyMove(state.board, action.index, state.humanMarker);
       if (!newBoard) return state;
 
-      const result = getGameResult(newBoard);
+      const result = resultOf(newBoard, state.variant);
       if (result.status === 'win') {
         const newStreak = state.streak + 1;
         const newBest = Math.max(state.bestStreak, newStreak);
@@ -62,7 +73,6 @@ export function reduce(state, action) {
           board: newBoard,
           phase: 'won',
           winLine: result.line,
-          lastPlacedIndex: action.index,
           scores: { ...state.scores, human: state.scores.human + 1 },
           streak: newStreak,
           bestStreak: newBest,
@@ -75,7 +85,6 @@ export function reduce(state, action) {
           ...state,
           board: newBoard,
           phase: 'draw',
-          lastPlacedIndex: action.index,
           scores: { ...state.scores, draw: state.scores.draw + 1 },
           streak: 0,
         };
@@ -86,26 +95,24 @@ export function reduce(state, action) {
         ...state,
         board: newBoard,
         currentTurn: state.aiMarker,
-        lastPlacedIndex: action.index,
       };
     }
 
     case 'AI_MOVE': {
       if (state.phase !== 'playing') return state;
       if (state.currentTurn !== state.aiMarker) return state;
-      const move = getAIMove(state.board.slice(), state.aiMarker, state.difficulty);
+      const move = action.index;
       if (move === null) return state;
       const newBoard = applyMove(state.board, move, state.aiMarker);
       if (!newBoard) return state;
 
-      const result = getGameResult(newBoard);
+      const result = resultOf(newBoard, state.variant);
       if (result.status === 'win') {
         const next = {
           ...state,
           board: newBoard,
           phase: 'lost',
           winLine: result.line,
-          lastPlacedIndex: move,
           scores: { ...state.scores, ai: state.scores.ai + 1 },
           streak: 0,
         };
@@ -117,7 +124,6 @@ export function reduce(state, action) {
           ...state,
           board: newBoard,
           phase: 'draw',
-          lastPlacedIndex: move,
           scores: { ...state.scores, draw: state.scores.draw + 1 },
           streak: 0,
         };
@@ -128,18 +134,16 @@ export function reduce(state, action) {
         ...state,
         board: newBoard,
         currentTurn: state.humanMarker,
-        lastPlacedIndex: move,
       };
     }
 
     case 'NEW_GAME': {
       return {
         ...state,
-        board: createBoard(),
+        board: emptyBoard(state.variant),
         currentTurn: 'X',
         phase: 'playing',
         winLine: null,
-        lastPlacedIndex: null,
       };
     }
 
@@ -148,11 +152,10 @@ export function reduce(state, action) {
         ...state,
         humanMarker: action.marker,
         aiMarker: opponent(action.marker),
-        board: createBoard(),
+        board: emptyBoard(state.variant),
         currentTurn: 'X',
         phase: 'playing',
         winLine: null,
-        lastPlacedIndex: null,
       };
       return s;
     }
@@ -161,11 +164,21 @@ export function reduce(state, action) {
       return {
         ...state,
         difficulty: action.difficulty,
-        board: createBoard(),
+        board: emptyBoard(state.variant),
+        currentTurn: 'X',
+        phase: 'playing',
+        winLine: null,
+      };
+    }
+
+    case 'SET_VARIANT': {
+      return {
+        ...state,
+        variant: action.variant,
+        board: emptyBoard(action.variant),
         currentTurn: 'X',
         phase: 'playing',
         winLine: null,
-        lastPlacedIndex: null,
       };
     }
 
@@ -0,0 +1,263 @@
+// Bitboard search for the larger m,n,k variants (up to 8x8). Each side's
+// stones live in a 64-bit board split into two 32-bit words (lo = cells
+// 0-31, hi = cells 32-63), so wins are checked with a couple of ANDs against
+// the lines through the last move only. Search is negamax with alpha-beta,
+// a Zobrist-hashed transposition table and iterative deepening under a
+// time budget.
+import { getWinPatterns } from './gameEngine.js';
+
+const WIN = 1000000;
+const MATE_BOUND = WIN - 1000;
+const EXACT = 0;
+const LOWER = 1;
+const UPPER = 2;
+const TT_BITS = 18;
+const TT_MASK = (1 << TT_BITS) - 1;
+const NEAR_RADIUS = 2;
+const ABORT = Symbol('abort');
+
+const geometries = new Map();
+
+function bitLo(cell) { return cell < 32 ? 1 << cell : 0; }
+function bitHi(cell) { return cell >= 32 ? 1 << (cell - 32) : 0; }
+
+function popcount(x) {
+  x -= (x >>> 1) & 0x55555555;
+  x = (x & 0x33333333) + ((x >>> 2) & 0x33333333);
+  x = (x + (x >>> 4)) & 0x0f0f0f0f;
+  return Math.imul(x, 0x01010101) >>> 24;
+}
+
+// xorshift32 with a fixed seed so hashes are stable across runs.
+function zobristKeys(count) {
+  const keys = new Int32Array(count);
+  let x = 0x9e3779b9 | 0;
+  for (let i = 0; i < count; i++) {
+    x ^= x << 13; x ^= x >>> 17; x ^= x << 5;
+    keys[i] = x;
+  }
+  return keys;
+}
+
+function getGeometry(size, k) {
+  const key = `${size}:${k}`;
+  let g = geometries.get(key);
+  if (g) return g;
+
+  const cells = size * size;
+  const lines = getWinPatterns(size, k);
+  const lineLo = new Int32Array(lines.length);
+  const lineHi = new Int32Array(lines.length);
+  const byCell = Array.from({ length: cells }, () => []);
+  lines.forEach((line, w) => {
+    for (const c of line) {
+      lineLo[w] |= bitLo(c);
+      lineHi[w] |= bitHi(c);
+      byCell[c].push(w);
+    }
+  });
+
+  const nearLo = new Int32Array(cells);
+  const nearHi = new Int32Array(cells);
+  for (let c = 0; c < cells; c++) {
+    const r = Math.floor(c / size);
+    const col = c % size;
+    for (let rr = Math.max(0, r - NEAR_RADIUS); rr <= Math.min(size - 1, r + NEAR_RADIUS); rr++) {
+      for (let cc = Math.max(0, col - NEAR_RADIUS); cc <= Math.min(size - 1, col + NEAR_RADIUS); cc++) {
+        nearLo[c] |= bitLo(rr * size + cc);
+        nearHi[c] |= bitHi(rr * size + cc);
+      }
+    }
+  }
+
+  // Static ordering: cells on more lines (the centre) first.
+  const order = Int32Array.from({ length: cells }, (_, c) => c)
+    .sort((a, b) => byCell[b].length - byCell[a].length || a - b);
+
+  const ttSize = TT_MASK + 1;
+  g = {
+    size, k, cells, lineLo, lineHi, order, nearLo, nearHi,
+    cellLines: byCell.map(ws => Int32Array.from(ws)),
+    weights: Array.from({ length: k + 1 }, (_, n) => (n === 0 ? 0 : 8 ** (n - 1))),
+    zobLo: zobristKeys(cells * 2),
+    zobHi: zobristKeys(cells * 4).subarray(cells * 2),
+    tt: {
+      check: new Int32Array(ttSize),
+      score: new Int32Array(ttSize),
+      depth: new Int8Array(ttSize).fill(-1),
+      flag: new Int8Array(ttSize),
+      move: new Int8Array(ttSize),
+    },
+  };
+  geometries.set(key, g);
+  return g;
+}
+
+export function clearTranspositionTables() {
+  for (const { tt } of geometries.values()) tt.depth.fill(-1);
+}
+
+// `stats`, when given, receives the node count of the search so callers
+// such as the benchmarks can compare work independently of timing.
+export function searchMove(board, size, k, player, { timeMs = 500, maxDepth = Infinity, stats } = {}) {
+  const g = getGeometry(size, k);
+  const { cells, lineLo, lineHi, cellLines, nearLo, nearHi, order, weights, zobLo, zobHi, tt } = g;
+  const lo = [0, 0];
+  const hi = [0, 0];
+  let hashLo = 0;
+  let hashHi = 0;
+  let stones = 0;
+
+  board.forEach((cell, c) => {
+    if (cell === null) return;
+    const s = cell === 'X' ? 0 : 1;
+    lo[s] |= bitLo(c);
+    hi[s] |= bitHi(c);
+    hashLo ^= zobLo[s * cells + c];
+    hashHi ^= zobHi[s * cells + c];
+    stones++;
+  });
+  if (stones === cells) return null;
+
+  const useNear = size >= 5;
+  const history = new Int32Array(cells);
+  const moveBuf = Array.from({ length: cells + 1 }, () => new Int32Array(cells));
+  const deadline = performance.now() + timeMs;
+  let nodes = 0;
+  let rootBest = -1;
+
+  function isWin(s, c) {
+    const sl = lo[s];
+    const sh = hi[s];
+    for (const w of cellLines[c]) {
+      if ((sl & lineLo[w]) === lineLo[w] && (sh & lineHi[w]) === lineHi[w]) return true;
+    }
+    return false;
+  }
+
+  function evaluate(s) {
+    const o = 1 - s;
+    let score = 0;
+    for (let w = 0; w < lineLo.length; w++) {
+      const mine = popcount(lo[s] & lineLo[w]) + popcount(hi[s] & lineHi[w]);
+      const theirs = popcount(lo[o] & lineLo[w]) + popcount(hi[o] & lineHi[w]);
+      if (theirs === 0) score += weights[mine];
+      else if (mine === 0) score -= weights[theirs];
+    }
+    return score;
+  }
+
+  function generate(ply, ttMove) {
+    const moves = moveBuf[ply];
+    const occLo = lo[0] | lo[1];
+    const occHi = hi[0] | hi[1];
+    const filterNear = useNear && stones > 0;
+    let n = 0;
+    for (let i = 0; i < cells; i++) {
+      const c = order[i];
+      if ((occLo & bitLo(c)) | (occHi & bitHi(c))) continue;
+      if (filterNear && ((occLo & nearLo[c]) | (occHi & nearHi[c])) === 0) continue;
+      // Insertion by history score keeps the static order as tie-break.
+      let j = n++;
+      while (j > 0 && history[moves[j - 1]] < history[c]) {
+        moves[j] = moves[j - 1];
+        j--;
+      }
+      moves[j] = c;
+    }
+    const at = ttMove >= 0 ? moves.subarray(0, n).indexOf(ttMove) : -1;
+    if (at > 0) {
+      moves.copyWithin(1, 0, at);
+      moves[0] = ttMove;
+    }
+    return n;
+  }
+
+  function negamax(s, depth, ply, alpha, beta) {
+    if ((++nodes & 1023) === 0 && performance.now() > deadline) throw ABORT;
+    if (depth === 0) return evaluate(s);
+
+    const alphaOrig = alpha;
+    const slot = hashLo & TT_MASK;
+    let ttMove = -1;
+    if (tt.depth[slot] >= 0 && tt.check[slot] === hashHi) {
+      ttMove = tt.move[slot];
+      if (ply > 0 && tt.depth[slot] >= depth) {
+        let stored = tt.score[slot];
+        if (stored > MATE_BOUND) stored -= ply;
+        else if (stored < -MATE_BOUND) stored += ply;
+        const flag = tt.flag[slot];
+        if (flag === EXACT) return stored;
+        if (flag === LOWER && stored > alpha) alpha = stored;
+        else if (flag === UPPER && stored < beta) beta = stored;
+        if (alpha >= beta) return stored;
+      }
+    }
+
+    const moves = moveBuf[ply];
+    const n = generate(ply, ttMove);
+    let best = -Infinity;
+    let bestMove = moves[0];
+
+    for (let i = 0; i < n; i++) {
+      const c = moves[i];
+      const bl = bitLo(c);
+      const bh = bitHi(c);
+      const zi = s * cells + c;
+      lo[s] |= bl; hi[s] |= bh;
+      hashLo ^= zobLo[zi]; hashHi ^= zobHi[zi];
+      stones++;
+
+      let score;
+      if (isWin(s, c)) score = WIN - ply - 1;
+      else if (stones === cells) score = 0;
+      else score = -negamax(1 - s, depth - 1, ply + 1, -beta, -alpha);
+
+      // An aborted search unwinds without undoing moves; the position is
+      // local to this call and is discarded with it.
+      stones--;
+      lo[s] ^= bl; hi[s] ^= bh;
+      hashLo ^= zobLo[zi]; hashHi ^= zobHi[zi];
+
+      if (score > best) {
+        best = score;
+        bestMove = c;
+        if (score > alpha) alpha = score;
+        if (alpha >= beta) {
+          history[c] += depth * depth;
+          break;
+        }
+      }
+    }
+
+    let stored = best;
+    if (stored > MATE_BOUND) stored += ply;
+    else if (stored < -MATE_BOUND) stored -= ply;
+    tt.check[slot] = hashHi;
+    tt.score[slot] = stored;
+    tt.depth[slot] = Math.min(depth, 127);
+    tt.move[slot] = bestMove;
+    tt.flag[slot] = best <= alphaOrig ? UPPER : best >= beta ? LOWER : EXACT;
+    if (ply === 0) rootBest = bestMove;
+    return best;
+  }
+
+  const side = player === 'X' ? 0 : 1;
+  const limit = Math.min(maxDepth, cells - stones);
+  generate(0, -1);
+  let bestMove = moveBuf[0][0];
+
+  for (let depth = 1; depth <= limit; depth++) {
+    let score;
+    try {
+      score = negamax(side, depth, 0, -Infinity, Infinity);
+    } catch (e) {
+      if (e !== ABORT) throw e;
+      break;
+    }
+    bestMove = rootBest;
+    if (Math.abs(score) > MATE_BOUND) break;
+  }
+  if (stats) stats.nodes = nodes;
+  return bestMove;
+}
@@ -0,0 +1,2 @@
+// Generated by scripts/buildMoveTable.mjs — do not edit by hand.
+export const MOVE_TABLE = '000kkkkkkkkk001fffkffff003kkfkffkf005fkkfkfk007kqqkqkk009fffkffff00bfkkqqkq00eqkdqkd00fkkqqkkq00gdkdddd00jfqkkqkq00lffkkkfk00mdkqdkq00rkffkkkff00tkkkfffk00wdkkdkd00xqkqffkk00ybbbdbb012dkkddd016dkdddd018ssdqq019qfkfffk01abbbdbb01cdkfdkq01esdddk01gssuqs01jqqqkkkk01lqfqkkfk01mdbbbbb01rqfqkkkq01sdbbbbb01uqbbbbb01wbbdbb01yskdks024skddd029kfkffkfk02bkkkkkkk02ebbbbkb02fqqqqqkq02gbbbbbd02kbbbkbb02obbbdbb02qssuks02rkkkkkkk02sbbbbbk02ubbbbkb02wsskuk02ysssku032bbkbbb036bbdbbb038subbb03hbbbb03ibbkbbb03ksubbb03nbbbb03osubbb03pbbbb03rqqqkqqq03sbbbbbd03ubbbbdb03wbbsub03ysksku040bbbdbb042bbubb045bubb046ssuks047bbbb04askksu04cskkus04dbbbb04jkkkkkkk04lkkkkkfk04mkbbbbb04rkkkkkkk04skbbbbb04ukbbbbb04wbbbbk04ybbbkb054bbkbb059kkkfkkk05abbbkbb05ckkdkdd05ebbbbk05gbbukb05ikkdkkd05kbbbbk05nkkku05obbbkb05pbkub05sbbubb05ubbkbb05vbubb064ukbbb06ausbbb06cusbbb06rffkkkffk06tfqfkkff06wdfkqkd06xkqfqkkf06yddkddd072bbbbbd076bbbbbd078sssqu079kkfkkff07adkkddd07cdkkdkd07edskdd07gssqqd07kbbqbbb07obbqbbb07qsubbb07zbbbb080bbqbbb082dubbb085sbbb086subbb087bbbb089kkkkkkk08adkdddk08cfkdfdk08ebbqbb08gkkkks08ibbbbbk08kbbsbu08nbubs08okssku08pbbbk08skkkkk08ukkkkd08vkdkk092bbkbbb096bbdbbb098subbb09hbbbb09ibbkbbb09ksubbb09nbbbb09osubbb09pbbbb0aikdkkdk0akbbkbb0anbukb0aokskds0apbbbk0atbubb0axbbbb0azubu0b0kkkkd0b1bbbk0b3bbkb0b5kub0b7kku0b9kkkfkkk0bakkddkk0bckkdddk0bebbbbk0bgbbbkb0bibbbbbk0bkbbbbu0bnbbbu0bobbbku0bpbbuk0bsbbkbb0bubbkbb0bvkukk0c0qqqqqq0c2bbbbd0c5ssku0c6bbbdb0c7bsub0cbbbbu0cfbbus0chbbu0cibbdbb0cjbubb0clsuks0cnbbb0cpubb0cskskkk0cukskdk0cvkbbb0d0sskku0d1bbbb0d3bbbb0d5bbu0d7bku0ddkbb0djfqkqqkk0dlfqkqkfk0dmqbbbbb0drqqkqkkk0dsdbbbbb0dudbbbbb0dwksddd0dyksskd0e4bbbbd0e9kkkkkkk0eabbbkbb0eckfdkdf0eekkdkk0egksuks0eikddkdd0ekkkkkk0enkkkd0eokkskk0epbkbb0esbbubs0eubbbbq0evbsbu0f4usbbb0fausbbb0fcusbbb0frqqqkqqq0fsbbbbbd0fubbbbdb0fwsksuk0fysssku0g0bbbdbb0g2skusk0g5bbbb0g6skuks0g7bbbb0gabbbbu0gcbbbus0gdbbbu0gikdkkdk0gkkkdkk0gnbbkb0gosksdk0gpbbbb0gtbkbb0gxbkbb0gzukk0h0bbbbk0h1bbbu0h3bbku0h5buk0h7ubu0hassssu0hcsssus0hdbbbb0hissuss0hjbbbb0hlbbbb0hnuub0hpusu0hvbuu0i4usbbb0iausbbb0icukbbb0isssukk0iuskkdk0ivbbbb0j0skkkk0j1bbbb0j3kbbb0j5bbk0j7ukb0jdubb0k9ffffkfff0kbkqfkkqq0keddkdkd0kfqkfqkkq0kgbdbbbb0kkbbdbbb0kobbkbbb0kqdusss0krqkfkkfq0ksbdbbbb0kuddkfkk0kwdkksk0kyusqss0l2qqkkdd0l6qbbbbb0l8dbbbb0lhsbbb0liqbbbbb0lkdbbbb0lnkkks0loubbbb0lrkkkqkqq0lsddkddd0luddkddd0lwdsqsq0lydskks0m0bbkbbb0m2dusss0m5sbbb0m6dusss0m7sbbb0madkkks0mcdkksk0mdkskk0mkbkbbbb0mobdbbbb0mqubbbb0n0kddddk0n2kbbbb0n5bbkb0n6sbbbb0n7bbbb0nhubbb0ntusbb0nxubbb0o0bbdbbb0o2sukss0o5bbbb0o6sukss0o7bbbb0oikkkss0ojbbbk0olbbkb0onkuk0opkku0orkkkkkkk0osbbkbbb0oukkkkdd0owbbbbk0oybubsb0p0dkkkkd0p2bbbbs0p5ssku0p6bbbkb0p7sbub0pakukss0pckkkdk0pdkbbb0pikbbbbb0pkbbbbk0pnkkku0poubbsb0ptsksu0pxsbub0pzbbb0q0ukdss0q3kbbb0q5bbk0qabbkbb0qcbbkbb0qdkubb0qibbkbb0qjsubb0qlsubb0qnbbb0qpbbb0qvkbb0r2dkdddd0r6dfdkdd0r8sbbbb0rhbbbb0rikfkkdd0rkkbbbb0rndkkd0roqbbbb0rpdbbb0rzusbb0sbusbb0sfubbb0siddkddk0skqskqs0sndddd0sokskks0spdkdk0stbbbb0sxbbbb0szusu0t0kkkkk0t1dkkk0t3dkkk0t5ksk0t7kks0thubbb0ttukbb0txukbb0utbkbb0uxbkbb0uzubb0v9kkkk0vbkbb0vekb0vfkbb0vgbk0vidkkdkk0vkbbbbs0vnkdku0vobbbkb0vpbkub0vtbbbu0vxbbus0vzbbu0w0kkdkk0w1bkbb0w3kkkk0w5bbk0w7usb0wbsssu0wfsbub0whbbb0wquu0wrsbbb0wtbbb0wwku0wxubb0x0kkkks0x1kkkk0x3dkdk0x5bbs0x7bkb0x9bbbk0xbbbu0xebu0xfbku0xguk0xjkkk0xlkkk0xmkk0xrqkkkqfq0xsbbdbbb0xudfdkdd0xwddssk0xysusss0y0bbbkbb0y2dkuss0y5bsbb0y6ssuss0y7bbbb0yabubbs0ycbbbbq0ydsbbu0yikbbbbb0ykdkddk0ynkkks0youssss0ytbkbb0yxbbbb0yzuss0z0ubbbs0z3kbbu0z5bbk0zabbsbb0zcbbsbb0zdsubb0zibbubb0zjbubb0zlbubb0znubb0zpubb0zvbbb100bbdbbb102sudss105bbbb106susss107bbbb10ibbbbs10jbbbu10lbbku10nbuk10pubu10tbsbb10xbbbb10zubb119sbbu11bbbb11eku11fubb11issuss11jbbbb11lbbbb11nuus11pusu121bbu123bus124bu12abbubb12cbbkbb12dbubb12ibbkbb12jbubb12lsubb12nbbb12pubb12vubb130ukkss133kbbb135bbk139kbbb13bbbk13eku13fusb13lubs14jqqfkkkq14lqffkffk14mdbbbbb14rqfkkfkq14sdbbbbb14uqbbbbb14wdbbbb14ydkkks154bsbbb159ffkkfkk15addkkqq15cddkkfq15edsddk15gdsdkd15iddkkfk15kdkskk15nkkks15odkskk15pkksk15sbsbbb15ubsbbb15vusss164usqss16aussqs16cubbbb16rkkkkkkk16sbbbbbk16ubbbbkb16wbsbub16ykssku170kddddk172bkbbb175ubsb176kksks177bbbk17assssu17csssus17dbbbb17ibbbkbb17kskusk17nbbbb17oskuks17pbbbb17tbkbb17xbkbb17zukk180ssuss181bbbb183bbbb185uus187usu18assksu18csbbub18dbbbb18isbbbb18jbbbb18lubbb18pkku18vsuu194ubbbb19auksks19cuksds19sbkbbb19ubkbbb19vubbb1a0kkdkk1a1kbbb1a3kbbb1a5bbk1a7bkb1b9kfffkfq1badddddk1bcqdfdfq1bebdbbb1bgkdsks1bibbbbbq1bkbsbbu1bnubbs1bokssku1bpbbbk1bsbbsbb1bubbsbb1bvduss1c0bbbqbb1c2dsuds1c5bsbb1c6dsuks1c7bsbb1cbbbbb1cfbbbb1chusu1cibbubb1cjbubb1clbubb1cnubb1cpubb1csqskqs1cuqbbbb1cvdbbb1d0sbbbu1d1bbbb1d3ubbb1d7kku1ddsbb1dibbbkbb1dkbbubb1dnbubb1dossuks1dpbbbb1dtbubb1dxbbbb1dzubu1e0ssuss1e1bbbb1e3bbbb1e5uub1e7usu1f0kbbbb1f1bbbk1f3ubsb1f7kku1f9ubbs1ffkbu1fgbk1fjssu1flsub1fmbb1fsbsbbb1fubsbbb1fvubbb1g0ssdku1g1bbbb1g3bbbb1g5bbu1g7bku1gibbdbb1gjsuss1glsuss1gnbbb1gpbbb1grbbbs1gtbbu1gwbu1gxbku1gyuk1hdubb1hjusu1hlubu1i4udsss1iauksks1icukssk1isdkddk1iudkkkk1ivsbbb1j0kkkkk1j1kbbb1j3kbbb1j5kkk1j7kkk1jdbbb1kassdsu1kcsskus1kdbbbb1kisskkk1kjbbbb1klbbbb1knkub1kpkku1kvbuu1l0dkkkk1l1bbbs1l3bbkb1l5kuk1l7kku1l9kkkk1lbkkk1lekb1lfkkk1lgbk1ljbbu1llbus1lmbu1lvuuu1m1usu1m3uub1ndubb1njukk1nlukk1orfkffkfkk1otfkfkfqf1owbbqbbb1oxkkkkkkk1oyddddkk1p2ddddkd1p6ddddkk1p8qkqss1p9kffkffq1padddddk1pcbbqbbb1pedudss1pgqkqss1pkfqkkdd1poffddkk1pqqbbbb1pzdddd1q0qfdfdq1q2dbbbb1q5sbbb1q6qbbbb1q7bbdb1q9kfkqkqf1qaddkddd1qcbbqbbb1qebubsb1qgkkkks1qiddkdfd1qkbbbsb1qnsbub1qokkkss1qpkddk1qsdskks1qudukss1qvsbbb1r2kbbbbb1r6kkddkk1r8kbbbb1rhbbkb1ribkbbbb1rkubbbb1rokbbbb1rpbbbk1rzukbb1sbubbb1sfusbb1sibdbbbb1skubbsb1sokkdss1spbbbk1stbbub1sxbbkb1szbub1t0sukss1t1bbbb1t7kku1t9kfkkkkk1taddkkkk1tcqqqqqq1tebbbbd1tgkkksk1tiddkkkk1tkbbbbs1tnsssu1tokkkks1tpkkkk1tsbbbsb1tubbbdb1tvssus1u0kdddkk1u2bbbbk1u5sksu1u6kkdsk1u7bbkb1ubdkku1ufddkk1uhbbs1uibbbsb1ujbbub1ulssus1unbbb1upbub1usbbkbb1uubbdbb1uvsubb1v0bbkbb1v1kubb1v3subb1v5bbb1v7kbb1vdbbb1vkfqfdqd1voffddkk1vqqbbbb1vzbbbd1w0qfkkdd1w2dbbbb1w5bsbb1w6qbbbb1w7dddd1whusbb1wtusbb1wxusbb1x0fdkdfk1x2bbbqb1x5bsub1x6kkdks1x7dddk1xbbbus1xfbbbk1xhbsu1xikkkkd1xjdkdk1xlbkbb1xnusb1xpkks1xzusbb1ybubbb1yfukbb1zbsbub1zfskkk1zhbbb1zqub1zrbkbb1ztubb1zxkbb1zybk200ddkdkk202bbbbs205sssu206kkdks207ddkk20bbbbu20fbbbk20hbbu20ibbbkb20jdkuk20lskus20nbbb20pbsb20tsssu20xsskk20zbbb218bu219ssus21bbbb21euu21fbbb21gub21ikdkks21jdkdk21lsksk21nbbb21pkks21rbbbk21tbbu21wuu21xkku21ybk221bkb223bkb224uk229kfkkqfq22adddkdf22cbbbqbb22edkuss22gkkkss22idddkdd22kdkssk22nbsbb22okkksk22pdkkd22sbbbbs22ubbubs22vbsbu230kdfdkf232kkkdk235bkbb236kkdsk237bbkb23bdkkd23fddkd23hksk23ibbbbq23jbbsu23lbsbu23nubs23pbus23sbbsbb23ubbubb23vbubb240bbsbb241dubb243bubb245ubb247sbb24dubb24ibdbbbb24kuskss24okkdss24pbbbk24tbbbb24xbbkb24zkuk250bubbs251bbbu257bbu25bkbbb25fkskk25hkbb25qkb25rbsbu25tubb25xbbb25ybu260susss261bbbb267ssu269bbbb26buub26fsus26gbb26jubu26sbbkbb26ubbdbb26vsubb270bbkbb271kubb273subb275bbb277kbb27dbbb27ikdksk27jbbkb27lksks27nbbk27pkuk27rkdkd27tbbk27wku27xksk27ykb281bub283bbb284uu292bbbbbd296bbbbbk298sbbbu29hbbbb29ibbbbbq29ksbbbu29nbbbb29osbbbu29pbbbb29zubbs2abubbs2afubbb2aibbbbbd2aksssqu2anbbbb2aokssku2apbbbk2atbbbb2axbbbb2azusu2b0kssku2b1bbbk2b3bbbb2b5usu2b7kku2bhubbb2btubbb2bxubbs2ctbbbb2cxbbbb2czubu2d9bbbb2dbubu2dfkbu2dgbk2dibbbbbk2dkbbbbu2dnbbbu2dosksku2dpbbbb2dtbbbu2dxbbbk2dzbbu2e0sdsku2e1bbbb2e3bbbs2e5bbu2e7usu2ebbbbu2efbbbb2ehbbu2eqbu2erbbbb2etbbu2ewbu2exubu2f0bbbku2f1bbuk2f3bbus2f5bbu2f7bku2f9bbus2fbbbu2feuu2ffbku2fguk2fjbku2flbku2fmuk2fzubbs2gbubbs2gfubbk2hbbbbd2hfbbbk2hhsbu2hqbb2hrbbbk2htsbu2hwbb2hxkbu2hybk2jqub2k2ub2k6uk2kbbbbu2kfbbbk2khbbu2kqbu2krbbbk2ktbbu2kwbu2kxsbu2kybb2l8uu2lkuu2loub2lrbbbk2ltbbu2lwbu2lxkku2lybk2m2bu2m6bk2m8u2m9kku2mabk2mcbk2meu2mgu2mibbbbbq2mkssdsu2mnbbbb2mossssu2mpbbbb2mtbbbb2mxbbbb2mzsuu2n0bbbbu2n1bbbu2n3bbbu2n5buu2n7ubu2nbbbbs2nfbbbb2nhsbu2nqbb2nrbbbu2ntbbu2nwbu2nxubu2o0bbbsu2o1bbus2o3bbub2o5buu2o7bsu2o9bbub2obbuu2oeub2ofbuu2ogub2ojbbu2olbuu2omuu2otbbbb2oxbbbb2ozubu2p9bbbu2pbubu2pfbbu2pgbu2pqub2q2uu2q6uu2q9bbbb2qbuuu2qfsuu2qgbb2qrbuu2qsbu2qyu2r0bbbsu2r1bbub2r3bbus2r5bbu2r7buu2r9bbus2rbbbu2reuu2rfbsu2rgub2rjbuu2rlbbu2rmuu2rrbbbb2rtbbu2rwbu2rxusu2s2bu2s6bb2s8u2s9ubu2scbu2seu2t9kfkkkff2takddkdd2tcbbbqbb2tebdubb2tgkkkkk2tikkfkdd2tkbkbbb2tnusbb2tokkkkk2tpdkkk2tsbbsbb2tubbubb2tvbubb2u0dkdkkd2u2dksdd2u5bsbb2u6kkkkd2u7dkkk2ubdkkd2ufdkkk2uhksk2uibbsbb2ujduss2ulbubb2unubb2upsbb2ussqsqd2uusbubb2uvbbbb2v0qbbbb2v1dbbb2v3ubbb2v7kks2vdubb2vibkbbbb2vkubsbb2vokkkkd2vpbbbk2vtkubb2vxkkkk2vzkbb2w0susss2w1bbbb2w7ssu2wbbbbb2wfbbkb2whkub2wqkb2wrbbbb2wtuub2wxsub2wybb2x0subbb2x1bbbb2x7kku2x9ukbb2xfkbb2xgbk2xjusu2xsbkbbb2xubdbbb2xvubbb2y0kdkkk2y1kbbb2y3sbbb2y5bbb2y7kkk2yibbkbb2yjkukk2ylsuks2ynbbb2ypkbb2yrkkkk2ytbbk2ywku2yxkkk2yykk2zdubb2zjusb2zlubb300qkdfkd302bbdbb305busb306kkkkd307ddkk30bbubs30fbbbk30hsbu30ibbbsb30jddud30lbbub30nbub30pbsb30tbbsb30xbbkb30zsub318bb319bbub31bbub31eub31fbub31gub31iqbbbb31jdddd31lubsb31pkks31rubbk31xkbu31ybk321bsb323bub324ub32bbbub32fbbkb32hbub32qub32rbbbb32tuub32xsub32ybb33rukbb33xkbb33ybk346uk349sub34abb34gu34ibbkbb34jkudk34lsuss34nbbb34pkbb34rbbbk34tbbu34wuu34xkku34ybk359skus35bbbb35euu35fbkb35guk35kbu35obk35qu361bsb363bbb364ub369sbu36abb36cub36gu36sskdsd36usskud36vbbbb370kskkd371kbbb373bbbb375kub377kkk37dbub37idkkkk37jkskk37lbbkb37nkuk37pkkk37rkkkd37tkkk37wkb37xkkk37ykk381bbb383bub384uu38duub38jusb38luub390sukks391bbbb397kku399bkbb39bukb39fkkk39gbk39jubu39rbkbb39tukk39xkkk39ybk3a2kb3a6kk3a8k3a9bus3aabu3agu3ajusu3arsub3asbb3ayu3bdubb3bjukb3blukb3c1bkb3c3bkb3c4ub3c9kkk3cakb3cckb3cek3cgk3djkqfqkqk3dlkkkkkkk3dmkbbbbb3drqkkqfkq3dsdbbbbb3dukbbbbb3dwdddkk3dybsbbb3e4dddkk3e9fkkqfqk3eabbbbqb3eckkddff3eedkkkk3egbsbub3eiddkdfd3ekdssdk3enkkks3eobsbbb3epubsb3esdssus3eudkkkk3evbbsb3f4uskks3faussss3fcussss3frqkqqqqq3fsbbbbbd3fukkddkk3fwdkkkk3fyssssu3g0bbbbdb3g2dssus3g5bbsb3g6sssus3g7bbbb3gadsssu3gcdkkkk3gdbbbs3gibbbdbb3gkksusk3gnbkbb3gossuss3gpbbbb3gtbbbb3gxbbbb3gzuus3h0skuss3h1bbbb3h3bkbb3h5ukk3h7uuu3hassksu3hcssdkk3hdbbbb3hisssus3hjbbbb3hlbbbb3hnbub3hpsuu3hvkku3i4usksk3iaubbbb3icuksks3issbbub3iuskdkk3ivbbbb3j0bkbbb3j1ubbb3j3kbbb3j5bbk3jdbub3k9kkffqkq3kadddkdf3kckkddff3kedkkkk3kgbbsbb3kibbbbbq3kkdsssu3knbbbs3kobbsbu3kpbubs3ksdsskd3kudkkkk3kvkksk3l0bbbqbb3l2ksuds3l5bkbb3l6bbubb3l7bubb3lbbbbb3lfbubb3lhubu3liskusd3ljbbbb3llbkbb3lnukk3lpuub3lskskks3luksdkk3lvkbbb3m0ssssu3m1bbbb3m3bbbb3m5bsu3m7sbu3mdkkk3mibbbdbb3mkksuss3mnbkbb3mossuss3mpbbbb3mtbbbb3mxbbbb3mzuuu3n0skuks3n1bbbb3n3bkbb3n5ukk3n7usu3o0kdsks3o1bbbk3o3kksk3o5bkb3o7ssu3o9bbbb3obbuu3oeub3ofsuu3ogbb3ojkku3olkkk3ombk3oskbbbb3ouksdkk3ovkbbb3p0bsbbu3p1ubbb3p3bbbb3p5bbu3pdbkb3pibdbbb3pjubsb3plkkss3pnbbk3prbubs3ptbbu3pwbu3q1bub3q3bkb3q4ub3qdukk3qjubu3qlusu3r4ussss3raussss3rcukssk3rssssus3ruskdkk3rvbbbb3s0skksk3s1bbbb3s3kbbb3s5kkk3s7sub3sdbus3tassssu3tcssdkk3tdbbbb3tisskus3tjbbbb3tlbbbb3tnkuk3tpsuu3tvbbu3u0sdksk3u1bbbb3u3kkks3u5kkk3u7suu3u9bbkb3ubkuk3uekb3ufsus3ugbb3ujbuu3ulbbk3umbu3uvusu3v1uuu3v3uus3wduus3wjuub3wlukk3xrqkkqqkk3xsbbdbbb3xukkdddd3xwkkkkk3xybusbb3y0bbbkbb3y2kduss3y5bkbb3y6bbubb3y7bubb3yakusks3yckkkkk3ydkbbb3yidbbbbb3ykkdsdd3ynkkkd3youbsbb3ytbsbb3yxbubb3yzubb3z0ukssk3z3kbbb3z5kkk3zaksskd3zckskkk3zdkbbb3zissuss3zjbbbb3zlbbbb3znuss3zpubb3zvkkk400bbdbbb402kussk405kbbb406susss407bbbb40iskskk40jbbbb40lkkkk40nkkk40pusu40tbbbb40xbbbb40zuub419bbbb41bkub41ekb41fuub41iskuks41jbbbb41lbkbb41nukk41pusu421kku423kkk424bk42asbubb42cskkkk42dbbbb42ibkbbb42jubbb42lkbbb42nbbk42vukk430ukbbb433kbbb435bbk439subb43bbbb43eku43lukk43vukb441ubb443usb44iddddkd44kksdsk44nkdkd44obbbsb44pbdub44tbbbb44xbbub44zbuu450kkskd451bkbb453kkkd455kkk457usb45bbbsb45fbbub45hbub45qub45rbbbb45tkub45wkb45xuub460kkskk461dkkd463dkdd465skk467bsb469bbbb46bsuu46ebb46fbuu46gub46jkkk46lkkk46mkk46tbbbb46xbbbb46zuub479bbkb47bkub47ekb47fsub47gbb489bbkb48bkuk48ekb48fsus48gbb48rkkk48sbk48ukk48wk48yu490bkbbb491ubkb493kkdd495bbk499bubs49bbbu49ebu49jkub49lkkk49mkb49rsubb49tbbb49wku4a2uu4a9ukb4ackb4aek4ajkbb4alksk4amkb4arbsu4asub4aubb4awu4b4k4bassuss4bcsskkk4bdbbbb4bisssud4bjbbbb4blbbbb4bnkuk4bpuub4bvubs4c0ukssk4c3kbbb4c5kkk4c9bbbb4cbkuk4cekb4cfuub4clubk4cvusb4d1uub4d3uub4diskuss4djbbbb4dlbkbb4dnukk4dpuuu4e1buu4e3bbk4e4bu4e9bbbb4ebkuk4eekb4efuus4erubk4euku4ewk4f1suu4f3sus4f4bb4fmu4fvuub4g1uub4g3ukb4glukk4grukb4gukb4gwk4i4ubbbs4iaubbbs4icubbbs4isbbbbd4iubbbbq4ivsbbu4j0bbbbq4j1sbbu4j3kbbu4j5bbk4j7bbb4jdbbb4kabbbbu4kcbbbbk4kdbbbu4kibbbbs4kjbbbu4klsbbu4knbbb4kpbbu4kvbbu4l0bbbus4l1bbbu4l3bbku4l5buk4l7buu4l9bbku4lbbuk4leku4lfbus4lgbu4ljbuu4llbus4lmbu4lvubu4m1ubu4m3ubb4ndubb4njubb4nlubs4osbbbbs4oubbbbq4ovsbbu4p0bbbbu4p1bbbu4p3bbbu4p5bbu4p7bbu4pdbbb4pibbbus4pjbbsu4plbbsu4pnbus4ppbub4prbbbu4ptbuu4pwbu4pxbuu4pyuu4q1bub4q3bub4q4uu4qdubs4qjubu4qlubu4r0bbbus4r1bbbu4r3bbsu4r5bub4r7buu4r9bbbu4rbbuu4reuu4rfbuu4rgbu4rjbuu4rlbus4rmbu4sjbbu4slbbb4smbu4srbbu4ssbu4suuu4syu4t4u4tdubb4tjubu4tlubu4u1bbb4u3bbb4u4uu4u9bbu4uauu4ucbu4ueu4wdubs4wjubs4wlubk4xvubu4y1ubu4y3ubk4yjbbu4ylbbk4ymbu4yrbbk4ysbu4yuku4ywk4yyu4z4u529ffffkfff52bkqkkfqf52edfkdkk52fkqkqfqk52gbbkbbb52kbbbdbb52obbbdbb52qqsuss52rqkkkfqq52sbbdbbb52uddkddk52wkkdks52ysudss532fkkkdd536fdkddd538qbbbb53hbdbb53ikddddd53kkbbbb53nkddk53osbbbb53pbbbb53rkkqqkqf53sbbkbbb53ufdkddd53wbbbqb53ysusss540bbbdbb542bbusb545bsub546ssuss547bbbb54adukss54cdsdks54dsbbb54kdkddkd54odbbbbb54qsbbbb54zbbbb550kbbbbb552kbbbb555bbbk556ubbbb55hukbb55tukbb55xubbb560dbbbbb562bbbsb565bbuk566ussss56bbbub56fbbbb56huub56iusdss56lbbbb56nbku56rkkkkkkk56skdkkdk56ukkkkdd56wkkkkd56ybbbbk570bbbkbb572kkuss575bkbb576bbubs577bsbu57abbbsb57cbbbkb57dssuk57ikkddkk57kkkdkk57nkkkk57obbbbk57pbbsu57tbkbb57xbkbu57zubs580bbbsb581bbub583kduk585bkb587bub58abbkbb58cbbkbb58dsubb58ibbubb58jbubb58lbubb58nubb58pubb58vbbb592bqbbbb596bqbbbb598ubbbb59iqqkkdd59kdbbbb59nkksk59odbbbb59pbsbb59zubbb5abusbb5afusbb5aibbkbbb5akbubsb5ankbub5aosusss5apbbbb5b0kddkd5b1bkbb5b3kksk5b5bkb5b7uss5bhubbb5btusbb5bxubbb5ctbsub5cxbbbb5czubb5d9sbbb5dbbbb5deuk5dfubb5dibbkbbb5dkkudss5dnkbbb5dobubbs5dpsbbu5e0bbbkb5e1skus5e3kkuk5e5bkb5e7bbb5ebbsbb5efbsbu5ehubb5erssus5etbbb5ewuk5exbbb5eyuu5f0kkuss5f1bkbb5f3bkbb5f5usb5f7ubs5fjbkb5flbkb5fmuk5frkkkkqqq5fsbbbkbb5fudddkdd5fwdkkks5fydsuss5g0dddkdd5g2dkksk5g5skkk5g6dkssk5g7bsbb5gadsuss5gcdqsqs5gdbsbb5gikdddkd5gkkkkkk5gndkkk5goskksk5gpbbbb5gtdkkk5gxdkkd5gzksk5h0sqksq5h1bbbb5h3dddd5h5kks5h7uus5habbubb5hcbbsbb5hdbubb5hibbsbb5hjbubb5hlsubb5hnbbb5hpubb5hvubb5i0dbbbbb5i2kkkss5i5bbbk5i6uskss5ibbbkb5ifbbbb5ihkuk5iiuskss5ilbbbb5inkku5itkkkk5ixkbbb5izkbb5j8kb5j9kbbb5jbkbb5jebk5jfubb5jiussss5jlbbbb5jnbsu5jrbbbb5jtbub5jwub5jxuus5k3usu5kabbkbb5kcbbkbb5kdsubb5kibbkbb5kjsubb5klkubb5knkbb5kpbbb5kvbbb5l0kkksk5l1bbkb5l3kdkd5l5kkk5l7buk5l9kkkk5lbkkk5lekk5lfbbk5lgku5ljbub5llbsb5lmub5mkbbbbbd5mobbbbbd5mqsbbbu5mzbbbb5n0bbbbbd5n2kbbbu5n5bbbk5n6sbbbu5n7bbbb5nhubbs5ntubbk5nxubbb5o0bbbbbd5o2qsssu5o5bbbd5o6ssssu5o7bbbb5obbbbb5ofbbbb5ohuuu5oisksku5ojbbbb5olbbbk5onkku5opusu5ozubbb5pbubbk5pfubbb5qbbbbb5qfbbbb5qhubu5qrbbbb5qtkbu5qwbk5qxubu5r0bbbbbk5r2ksksu5r5bbbk5r6bbbbu5r7bbbu5rbbbbb5rfbbbu5rhbuu5risksku5rjbbbb5rlbbbk5rnkku5rpubu5rtbbbk5rxbbbu5rzbbu5s8bu5s9bbbb5sbkbu5sebk5sfubu5sibbbsu5sjbbus5slbbuk5snbsu5spbbu5srbbub5stbuu5swub5sxbuu5syuu5t1bku5t3bku5t4uk5thubbb5ttubbk5txubbs5utbbbb5uxbbbb5uzubu5v9bbbk5vbkbu5vebk5vfsbu5vgbb5x8ub5xkuk5xoub5xtbbbb5xxbbbu5xzubu5y9bbbk5ybkbu5yebk5yfbbu5ygbu5yquu5z2uk5z6uu5z9bbbb5zbsuu5zebb5zfbuu5zgbu5zrkku5zsbk5zubk5zwu5zyu600bbbbbd602ksksu605bbbk606ssssu607bbbb60bbbbb60fbbbb60hsuu60isqssu60jbbbb60lbbbd60nkku60puuu60tbbbk60xbbbb60zsbu618bb619bbbb61bkbu61ebk61fubu61ibbbsu61jbbub61lbbud61nbsu61pbuu61rbbub61tbuu61wub61xbuu61yub621buu623bsu624ub62bbbbb62fbbbb62hubu62rbbbb62tkbu62wbk62xubu638ub63kuk63oub63rbbbb63tsuu63wbb63xuuu649usu64cbb64eu64ibbbsu64jbbub64lbbuk64nbku64pbuu64rbbus64tbku64wuk64xbbu64yuu651buu653bsu654ub659bbbb65bkku65ebk65fubu65kbk65obu65qu65rusu65ubb65wu66rqkqkkqf66sbbbdbb66ukddddd66wbkbbb66ysdusk670bbbbdb672bkbub675ubkb676sksuk677bbbb67abbubb67cbbsbb67dbubb67idddkkd67kkkksd67ndkkd67odkssd67pbsbb67tbbkb67xbbkb67zkuk680bbsbb681bubb683dudd685sbb687ubb68assusd68csbbbb68dbbbb68isbbub68jbbbb68lubbb68puus68vubb690kbbbbb692bbkbb695bubk696usssd69bbukb69fbbbb69hkub69iussss69lbbbb69nsbu69tbbkb69xbbbb69zkub6a8kb6a9bbbb6absub6aebb6afuub6aiubbbb6alubbb6arubbb6axuub6b3ubu6babsbbb6bcbsbbb6bdubbb6bisskuk6bjbbbb6blbbbb6bnkub6bpbuk6c0bbkbb6c1suks6c3kukd6c5kbb6c7bbb6c9bbkb6cbkuk6cekb6cfbuk6cgku6cvubb6d1uub6d3uub6dibbdbbb6dkbusbb6dnsubb6dosussd6dpbbbb6e0bbbsb6e1bbub6e3ssud6e5bbb6e7bub6ebbbbb6efbbbb6ehuub6erbbub6etbub6ewub6exbub6eyub6f0sbubb6f1bbbb6f3usbb6f7uus6fjbub6flbbb6fmub6ftbbub6fxbbbb6fzuub6g9bbbb6gbbub6geub6gfuub6h9ubbb6hfuub6hrubb6huub6i0bbubb6i1bubb6i3bubb6i5ubb6i7ubb6irbbub6itbub6iwub6ixbub6iyuu6jjbub6jlbub6jmub6kasskud6kcskksd6kdbbbb6kiskkkd6kjbbbb6klkbbb6knkbb6kpkuk6kvbub6l0kkkkk6l1bbkb6l3kdkd6l5kkk6l7kuk6l9kkkd6lbkkk6lekk6lfkkk6lgkb6ljbub6llbsb6lmub6lvuub6m1uub6m3ubb6miuskks6mlbbbb6mnbku6mrkbbb6mtbkb6mwuk6mxukk6n3usu6n9kbbb6nbkkk6nebk6nfukk6nkkk6nokb6nqk6nruss6nubb6nwu6o3ubu6o9ubb6ocub6ovubb6p1ukb6p3ukb6pjbkb6plbkb6pmub6prkkk6pskb6pukb6pwk6pyk6r2bbbbbq6r6bbbbbk6r8sbbbu6rhbbbb6ribbbbbd6rksbbbu6rnbbbb6rosbbbu6rpbbbb6rzubbk6sbubbs6sfubbs6sibbbbbq6skbbbbu6snbbbu6sossssu6spbbbb6stbbbu6sxbbbb6szbuu6t0sssdu6t1bbbb6t3bbbb6t5ubu6t7usu6thubbs6ttubbb6txubbb6utbbbu6uxbbbb6uzbbu6v8bu6v9bbbb6vbubu6vfubu6vibbbbbk6vkdsksu6vnbbbs6voksksu6vpbbbk6vtbbbb6vxbbbb6vzsuu6w0bbbbu6w1bbbu6w3bbbu6w5bbu6w7bbu6wbbbbk6wfbbbk6whsbu6wqbb6wrbbbu6wtbbu6wwbu6wxbbu6wybu6x0bbbsu6x1bbus6x3bbus6x5bbu6x7bsu6x9bbub6xbbuu6xeuu6xfbuu6xgub6xjbbu6xlbbu6xmuu6xzubbb6ybubbs6yfubbs6zbbbbu6zfbbbb6zhubu6zrbbbs6ztbbu6zwbu6zxsbu6zybb71quu722uu726ub72bbbbb72fbbbb72hubu72rbbbu72tbbu72wbu72xbbu72ybu738ub73kuu73ouu73rbbbb73tbuu73wbu73xsuu73ybb749bbu74abu74cbu74eu74gu74ibbbbbd74kskksu74nbbbb74oskksu74pbbbb74tbbbk74xbbbk74zkku750ssqsu751bbbb753bbbb755suu757suu75bbbbk75fbbbk75hkbu75qbk75rbbbd75tsbu75wbb75xsbu75ybb760bbbsu761bbub763bbub765buu767buu769bbus76bbbu76euu76fbsu76gub76jbuu76lbuu76mub76tbbbb76xbbbb76zkbu778bk779bbbb77bubu77fubu77quk782ub786ub789bbbb78bubu78fusu78kbu78obb78qu78ruuu790bbbku791bbus793bbus795bku797bku799bbuk79bbku79euk79fbku79guk79jbbu79lbbu79muu79rbbbk79tkku79wbk79xkku79ybk7a2bk7a6bk7a8u7a9bbu7aabu7acbu7aeu7agu7viqkdqkd7vkbbdbb7vnbusb7vokkddd7vpbbkb7vtbubk7vxbbbk7vzkbu7w0bbbsb7w1bbub7w3bbub7w5bub7w7bub7wbkskk7wfkskk7whkbb7wqbk7wrssud7wtbbb7wwub7wxbbb7wyub7x0dbbbb7x1bbsb7x3ubsb7x7sus7x9ubbs7xfsbu7xgbb7xjbub7xlbub7xmub7xtsbub7xxsbbb7xzbbb7y8uk7y9bbbb7ybubb7yfubb7yquk7z2ub7z6ub7z9ubbb7zfubb7zoub7zruub800bbkbb801kuss803suss805bbb807kbb809bbbk80bbku80euk80fkku80gbk80rkkuk80tbkb80wuk80xbkb80yuk812bk816bk818u81jbbb81lbbb81muu81rbbu81sbu81uuu81yu82bbsub82fbsbb82hubb82rsssu82tbbb82wuu82xbbb82ybu838ub83kuu83ouu83rubsb83xsub83ybb849bbb84abu84cuu84gu84quu852uu856ub866ub86iub86ou86rbbub86tbub86wuu86xbub86yub87kbu87obu87qu889bbu88abu88cuu88gu890dddks891bbbs893bbbs895bku897kku899kksk89bbkb89euk89fkkk89gbk89jbbu89lbbu89mbu89rkkdk89tkkk89wbk89xkkk89ybk8a2kk8a6kk8a8k8a9bbs8aabu8acbu8aeu8agu8ajbbu8albbu8ambu8arbbb8asbu8auuu8ayu8b4u8b9bbbb8bbubk8bfukk8bkku8bokb8bqk8bruus8c2kb8c6kb8c8k8cibb8cku8cou8cruub8d0ub8d6u8djbbb8dlbbb8dmuu8drbbk8dsku8duku8dwk8dyk8e9bbk8eaku8ecku8eek8egk8eikk8ekk8eok8frkkqkqqk8fsbbbkbb8fukkdddd8fwkkkkk8fybbubb8g0bbbbdb8g2kksus8g5bbkb8g6bbsub8g7bubb8gaksuds8gckkkkk8gdbkbb8gidddkdd8gkkkksd8gnkkkd8gobbsbb8gpbubb8gtbbkb8gxbudb8gzsub8h0sksdk8h1bbbb8h3kkdd8h5kkk8h7ubu8hassusd8hcsskkk8hdbbbb8hisssus8hjbbbb8hlbbbb8hnbus8hpuub8hvukk8i0dbbbbb8i2ksksk8i5kkkk8i6ussss8ibbbbb8ifbbbb8ihsuu8iiukssk8ilkbbb8inkkk8itbbkb8ixbbbb8izsub8j8bb8j9bbbb8jbkub8jekb8jfuub8jiuksss8jlkbbb8jnbbk8jrbbbb8jtbuu8jwbu8jxuuu8k3ukk8kakbbbb8kckskkk8kdkbbb8kibsbub8kjubbb8klbbbb8knkuk8kvbbk8l0bkbbb8l1ubbs8l3kkdd8l5kkk8l9bukb8lbkub8lekb8ljbbu8llbbk8lmbu8lvukb8m1uub8m3uub8mibbdbbb8mkkussk8mnkbbb8mobubsb8mpbbub8n0dkdsd8n1bbsb8n3kkkd8n5kkk8n7bub8nbbbbb8nfbbub8nhuub8nrbbsb8ntkub8nwkb8nxbub8nyub8o0skusk8o1bbbb8o3bkbb8o5ubk8o7uub8ojkuk8olkkk8omkb8otbbbb8oxbbbb8ozuub8p9bbbb8pbkub8pekb8pfuub8q9bbbb8qbbuk8qeku8qfuus8qrukk8qukb8qwk8r0bkubb8r1usbb8r3bkbb8r5ukk8rjbbb8rlbbk8rmku8rrbusb8rtkub8rwkb8s9bbb8sauu8scku8sek8sjkub8slkuk8smkb8t4k8tasssus8tcskkkk8tdbbbb8tiskksd8tjbbbb8tlkbbb8tnkkk8tpbub8tvsus8u0skkkk8u1bbbb8u3kddd8u5kkk8u7buu8u9kdkd8ubkkk8uekk8ufbsb8ugub8ujsuu8ulskk8umbb8uvuub8v1uub8v3usb8viuksks8vlkbbb8vnkkk8vrbbbb8vtkku8vwbk8vxusu8w3ukk8w9kbbb8wbkkk8wekk8wfuss8wkbk8wobb8wqu8wrukk8wukb8wwk8x3uss8x9usu8xcbb8xeu8xvusb8y1ubb8y3ukb8yjsbu8ylskk8ymbb8yrbkb8ysub8yukb8ywk8z4u900ddddkd902ksdkk905kdkk906bbbsb907bbub90bbbbb90fbbub90hbuu90iskkkd90jbbbb90lkkkd90nkkk90puub90tskkk90xsbub90zbbb918ub919kbbb91bkbb91ekk91fubb91idkssk91jbbsb91ldkkd91nskk91pbub91rbbbb91tsuu91wbb91xbuu91yub921kuk923kkk924kb92bbkbb92fbbbb92hubb92rkbbb92tkbb92wkk92xubb938ub93kuk93oub93rbbbb93tkuk93wkb93xuus949ukk94ckb94ek94ibkbbb94jubsb94lkkkk94nkkk94rbubs94tkbu94wbk951kub953kkk954kb959kubb95bkbb95ekk95kuk95rukb95ukb95wk961bbb963bbk964ku969bbu96auu96cbu96eu96mk96tbkbb96xbsbu96zubb979kskk97bkbb97ekk97fbbb97gbu97quu982uk986uu989bbkb98bkuk98ekb98fbus98gbu98rkkk98sbk98ukk98wk98yu998ub99kuk99oub9akbk9aobb9aqu9b0kb9b2k9b6u9b9bukb9bbkub9bekb9brbkb9bsuk9bukk9bwk9c2uk9ciku9ckk9crbku9csuk9cubk9cwu9dak9dck9diskdks9djbbbb9dlkddk9dnkkk9dpbuu9drbbbs9dtkku9dwbk9dxbbu9dybu9e1suu9e3skk9e4bb9e9kbbb9ebkkk9eekk9efubs9ekbk9eobu9equ9erukk9eukb9ewk9f1bbu9f3bbs9f4bu9f9bbu9fabu9fcbu9feu9fgu9fmu9frbbbb9ftkuk9fwkb9fxuus9g9ukk9gckb9gek9gkbk9gobb9gqu9h0kb9h2k9h6u9h9usu9hcbb9heu9huu9i1bbu9i3bbk9i4bu9i9bbb9iauu9icku9iek9imu9irukb9iukb9iwk9j0ku9j2k9jcu9kassdus9kcssqkq9kdbbbb9kissqsu9kjbbbb9klbbbb9knkbu9kpbuu9kvbub9l0dqqss9l1bbsb9l3dddd9l5kks9l7bub9l9bbbd9lbkku9lebk9lfbsu9lgub9ljbub9llbsb9lmub9lvuus9m1uuu9m3ubu9miuksss9mlkbbb9mnbkb9mrbbbb9mtbku9mwuk9mxusu9n3uss9n9bbbb9nbkku9nebk9nfusu9nkbk9nobb9nqu9nrusu9nubb9nwu9o3ubb9o9ubu9ocub9ovubb9p1ubu9p3usu9pjbbb9plbsb9pmub9prbsu9psub9pubb9pwu9r0squss9r1bbbb9r3bdbb9r5usb9r7ubu9rjbbu9rlbbs9rmbu9rrbbbb9rtsuu9rwbb9rxbuu9rybu9s9bbu9sabu9scbu9seu9sgu9sjsuu9slsub9smbb9t4u9t9bbbb9tbbuu9tebu9tfuuu9trusu9tubb9twu9urubu9uuub9vcu9vjbub9vlbub9vmub9w9bbu9wauu9wcbu9weu9x4u9xvusu9y1usu9y3ukk9yjssu9ylskk9ymbb9yrskk9ysbb9yukb9ywk9yyu9z4ua03ukka09ukka0ckba0eka0rukka0ukba0wka10kba12ka16ua1cua1uua34ua3aua3cua4jfqfkkqka4lfqfkfkfa4mqbbbbba4rqqkkfqka4sdbbbbba4udbbbbba4wbsbbba4ykkdska54bbdbba59ffkkfqfa5abbbbqba5cdqdfqfa5ebsbbba5gkssuka5iddddkda5kbsbbba5nudssa5oksdska5pbbkba5sbbsuba5ubbdbba5vbusba64uskksa6auskska6cusdssa6rkkkkkkka6sdkddkda6ubbbbbka6wssssua6ykskska70bbbbkba72sssusa75bbbba76kssuka77bbkba7abbkbba7cbbsbua7dbubsa7ibbbkbba7kssussa7nbbbba7ossuska7pbbbba7tbbbba7xbbbba7zuusa80bbubba81bubba83bubba85ubua87uuba8asskkka8cssksua8dbbbba8issdusa8jbbbba8lbbbba8nbuua8pkuka8vkbua94usksda9auskska9cubbbba9sssduka9usbbbba9vbbbbaa0sbbbbaa1bbbbaa3ubbbaa7bukaadbubab9kfffkkkabaddkkkfabcddkkqfabebbsbbabgdskkkabiddkkqqabkbbsbbabnsussaboddsdkabpkkksabsdskkkabuddskdabvkkskac0bbbqbbac2bbubbac5bubbac6sduskac7bbbbacbbubbacfbsbbachubbacisdusdacjbbbbaclbsbbacnubbacpuusacskkkkkacukdkkkacvkbbbad0kddkdad1kbbbad3sbbbad5bbbad7kkkaddkkkadibbbkbbadkssussadnbbbbadoksuskadpbkbbadtbbbbadxbbbbadzuusae0ksuksae1bkbbae3bbbbae5usuae7ukkaf0kkdkkaf1kkkkaf3bbbkaf5bsuaf7kkkaf9bbsbafbbubafeubaffkukafgkbafjkkkaflkkuafmbkafskkdkkafukbbbbafvkbbbag0kbbbbag1kbbbag3ubbbag7bbkagdbkbagidbbbbagjbbsbaglusssagpbukagrusssagxbbbagykuah1bubah3bbbah4ubahdukkahjukkahlubbai4ubbbbaiausssqaicuqsssaisbsbubaiubqbbbaivubbbaj0sqksqaj1bbbbaj3dbbbaj5sbbaj7kukakabsbbbakcbsbbuakdubbbakisskusakjbbbbaklbbbbaknsuuakpkukal0bbkbbal1busbal3bubsal5sbual7kubal9bbkbalbsusalebbalfkukalgkbalvubuam1uusam3uuuanduubanjuusanlubbaorqkqqkkfaosbbdbbbaoudkddddaowbbsbbaoysuskkap0bbbdbbap2bbubbap5bubbap6ssudkap7bbbbapabubkbapcbbbkbapdkbubapidbbbbbapkbbsbbapnsusdapousssdaptbubbapxbbbbapzubbaq0ubbsbaq3sbubaq5bbbaqakskkdaqcksskdaqdkbbbaqissukdaqjbbbbaqlbbbbaqnubbaqpukkaqvbkbar0bbkbbbar2susssar5bbbbar6sussdar7bbbbaribbbkbarjbkubarlbbukarnbsuarpukbartbbbbarxbbbbarzuubas9bbubasbbubaseubasfuubasiksuksasjbkbbaslbbbbasnusuaspukkat1bkbat3bkuat4ukatassukkatcsbbbbatdbbbbatisbbbbatjbbbbatlubbbatpubkatvukbau0ubbbbau3ubbbau9ubbbaufubbaulubbauvukbav1ukbav3ubbavidddkkdavkbbbsbavnddudavokdssdavpbkbbavtbbubavxbbsbavzbubaw0kkskdaw1bkbbaw3dkkdaw5bsbaw7ukkawbbbubawfbbbbawhbubawqubawrbbbbawtbubawwubawxuubax0kkkkkax1kkkdax3dkkdax5bsbax7kkkax9bbkbaxbbubaxeubaxfkukaxgkbaxjkkkaxlkkkaxmkkaxtbbbbaxxbbbbaxzuubay9bbkbaybsubayebbayfkubaygkbaz9bbkbazbsusazebbazfkukazgkbazrkkkazskkazubkazwuazykb00kbbbbb01bbkbb03ukkdb07bukb09usksb0fbbbb0gkub0jkukb0lkbbb0mkbb0rubbbb0xubbb16uub19ubbb1cubb1jkkkb1lkbbb1mkbb1rkbbb1skbb1uubb1ykb24kb2absubbb2cbsbbbb2dubbbb2isssudb2jbbbbb2lbbbbb2nbubb2puusb30ubsbbb33subbb35bbbb39bbbbb3bbubb3eubb3fuusb3vubbb41uubb43uubb4ibbubbb4jbubbb4lbubbb4nubub4puubb59bbubb5bbubb5eubb5fuubb61bubb63buub64ubb6vuubb71uubb73ubbb7lubbb7rubbb7uubb94ubbbsb9aubbbkb9cubbbsb9sbbbbdb9ubbbbdb9vsbbuba0bbbbkba1kbbuba3sbbuba5bbbba7bbkbadbbbbbabbbbkbbcbbbbubbdbbbubbibbbbkbbjkbbubblbbbubbnbbubbpbbkbbvbbubc0bbbusbc1bbsubc3bbbubc5buubc7bukbc9bbkubcbbusbcebubcfbukbcgkubcjbubbclbuubcmuubcvububd1ubkbd3ububedubbbejubkbelubbbfsbbbbkbfubbbbdbfvsbbubg0bbbbdbg1kbbubg3sbbubg5bbbbg7bbkbgdbbbbgibbbudbgjbbsubglbbsubgnbubbgpbukbgrbbsubgtbubbgwuubgxbukbgykubh1bubbh3bubbh4uubhdubsbhjubkbhlubbbi0bbbusbi1bbkubi3bbbubi5buubi7bukbi9bbsubibbubbieuubifbukbigkubijbusbilbuubimbubjjbbkbjlbbubjmbubjrbbbbjskubjuuubjykbk4ubkdubbbkjubkbklubbbl1bbbbl3bbbbl4uubl9bbbblakublcuublgkbndubbbnjubkbnlubsbovububp1ubkbp3ububpjbbbbplbbubpmuubprbbkbpskubpububpwubpykbt9kfkfkkfbtakkdkfdbtcbbbqbbbtebbubbbtgkkkkkbtidkdkddbtkbbsbbbtnbubbbtokkkkkbtpkkdkbtsbbbkbbtubbudbbtvbsubbu0dkqkfdbu2bbsbbbu5bubbbu6kkkkdbu7bbbkbubduddbufdkdkbuhsbbbuibbbdbbujbbusbulbsubbunubbbupbsubusskkkdbuussukdbuvbbbbbv0kssddbv1kbbbbv3bbbbbv5ubbbv7kkkbvdukbbvibkbbbbbvkussssbvokkkkdbvpkkkkbvtbbbbbvxbbbkbvzssubw0bubsbbw1kbubbw7bkbbwbbbbbbwfbbkbbwhsubbwqbbbwrbbubbwtuubbwxbubbwyubbx0kusksbx1kbbbbx7kkkbx9bbbbbxbububxfkkubxgbkbxjukbbxsdkkkkbxudbbbbbxvsbbbby0kbbbbby1kbbbby3ubbbby7kkkbydbbbbyikbbbbbyjbbbkbylusssbypkkubyrukdkbyxkbbbyybkbz1bbubz3bbbbz4uubzdukbbzjukbbzlubbc00dkdkkdc02bbbsbc05bbubc06kkkkdc07dkkkc0bdsusc0fdkkkc0hbsbc0ikddsdc0jdkkdc0lbbsbc0nbubc0pskkc0tbbubc0xbbkbc0zbubc18ubc19bbsbc1bbubc1eubc1fsubc1gbbc1ikkdkkc1jkkkdc1lbbkbc1nbubc1pkkkc1rskkkc1tbbbc1wuuc1xkkkc1ykkc21kkkc23kukc24kbc2bbbbbc2fbbkbc2hsubc2qbbc2rbbbbc2tuubc2xkubc2ykbc3rbkbbc3tubsc3xkkkc3ykkc42buc46bkc48uc49kukc4akbc4gkc4ikbbbbc4jkkkkc4lusksc4pkkkc4rukkkc4xkbbc4ykkc51bbkc53bbbc54kuc59ukssc5fkbbc5gbkc5oukc5rbbbc5sbuc5uuuc5yuc61kkkc63kbbc64kbc69kbbc6akbc6cubc6gkc6mkc6sbqbbbc6ubsbubc6vubbbc70qsqsdc71dbbbc73bbbbc75bubc77kksc7ibbqbbc7jbubkc7lbusbc7nbubc7pkbuc7rddddc7tbsbc7wubc7xkksc7ybkc8duubc8jusbc8luubc90busbbc91kubbc97kbbc99bbbbc9busuc9fkkuc9gbkc9rbkubc9tusbc9xbkbc9yukca2bbca6bkca8ucajusbcarsuucasbbcayucbdubbcbjusbcblubbcc1bsucc3bbbcc4ubcc9sbbccabbcccubccgucdidkqdkqcdkbbbsbcdnbbubcdokkdddcdpbkbbcdtbbubcdxbbkbcdzbubce0bbbbdce1bkbuce3bbsuce5bubce7ubkcebssuscefsbbbcehbbbcequbcersbbucetbbbcewuucexubbcf0dddskcf1kkkscf3bbsbcf5bubcf7kkkcf9bbsbcfbbubcfeubcffkukcfgkbcfjbbkcflbukcfmkucftbbbbcfxbsbbcfzubbcg9bsbucgbubbcgfbbbcggkucgqubch2uuch6uuch9bbbbchbuuschfkukchgkbchrbukchskuchykci0kbbbbci1bbkbci3usssci7kukci9uksscifkbbcigkbcijbukcilbbbcimkucirubbbcixubbcj6ubcj9ubbcjcuucjjbbkcjlbbbcjmkucjrbbbcjskucjuuucjykck4kckbssduckfskkkckhbbbckqbuckrskkkcktbbbckwbuckxkbbckykbcl8uuclkuucloubclrdkkkcltbbsclwbuclxkkkclykkcm2bucm6bkcm8ucm9kkkcmakkcmcbkcmeucmgkcmqubcn2ubcn6ukco2bbco6bkco8ucoibkcokucookcorukkkcoxkbbcoybkcp6ukcp9kbbcpabkcpcukcpgucpoubcq0ubcq6ucq9kbbcqakkcqcukcqgkcqiukcqokcqskcqukcr0bbdbbcr1busbcr3bubscr5bbucr7subcr9bbbscrbbbucrebucrfssucrgbbcrrsbubcrtbbbcrwuucrxusbcs2bucs6bbcs8ucsjbbbcslbbucsmuucsrbbucssbucsubucswucsyuct9bbubctbuubctfbubctgubcu2bucu6bucu8ucurbuucusbucuyucvjbbucvlbbbcvmuucvrbbbcvsbucvuuucvyucw9ubbcwcuucwiubcwoucxsskdkkcxussdudcxvbbbbcy0kskkdcy1kbbbcy3bbbbcy5bubcy7kkkcydbubcyiddksdcyjkskkcylbbsbcynbubcypkkkcyrdkkdcytbsbcywubcyxkkkcyykkcz1bbbcz3bubcz4uuczduusczjukkczluubd00kukssd01kbbbd07kkkd09bkbbd0busbd0fkkkd0gkkd0jubsd0rbbbbd0tusud0xkkud0ybkd12bbd16bkd18ud19buud1abud1gud1jukkd1rkubd1skbd1ykd2dubbd2jukkd2lubbd31bkbd33bbbd34ubd39kbbd3akbd3cubd3gkd4ikdddsd4jkddkd4lbbbsd4nbbud4pkkkd4rskkkd4tbbbd4wuud4xkkkd4ykkd51bbsd53bbud54bud59bbbsd5bbbud5ebud5fkkud5gbkd5kbud5obkd5qud5rbbud5sbud5ubud5wud5yud61skkd63sbud64bbd69kbbd6akbd6cubd6gkd6mud6rbbbbd6tubud6xkkud6ybkd72bud76bkd78ud79suud7abbd7gud89kubd8akbd8gkd8iukd8okd8sud91bkbd93bbbd94ubd99kbbd9akbd9cubd9gkd9rbbbd9skud9uuud9ykda0ukda6kdamudasudauudbdubudbjukkdblusudc1bkbdc3bsudc4ubdc9kskdcakbdccbbdceudcgkddjukbddrkukddskbddykde9bukdeakudegkdeibkdekudeokdfaudgmudgsudguudi4ubbbsdiaubbbsdicubbbsdisbbbbudiubbbbqdivbbbudj0bbbbsdj1bbbudj3sbbudj5bbbdj7bbudjdbbudkabbbbsdkcbbbbkdkdsbbudkibbbbudkjbbbudklbbbudknbbudkpbbudkvbbbdl0bbbusdl1bbbudl3bbsudl5busdl7buudl9bbbudlbbuudlebudlfbuudlgbudljbuudllbubdlmuudlvubkdm1ubudm3ubudndubudnjubudnlubbdosbbbbqdoubbbbqdovkbbudp0bbbbddp1sbbudp3sbbudp5bbbdp7bbbdpdbbkdpibbbusdpjbbbudplbbsudpnbubdppbuudprbbsudptbubdpwuudpxbubdpyuudq1buudq3busdq4budqdubkdqjubsdqlubsdr0bbbusdr1bbkudr3bbkudr5busdr7busdr9bbbudrbbuudrebudrfbuudrgbudrjbukdrlbukdrmkudsjbbkdslbbkdsmkudsrbbudssbudsubudswudsyudt4kdtdubsdtjubbdtlubbdu1bbudu3bbbdu4budu9bbbduauuducuudumudwdubudwjubudwlubsdxvubbdy1ubudy3ubudyjbbudylbbbdymuudyrbbudysbudyubudywudyyue2assusqe2cssqkqe2dbbbbe2isssude2jbbbbe2lbbbbe2nbube2puube2vubke30uqssse33dbbbe35bsbe39bbbbe3bbube3eube3fuube3lubse3vukke41uuse43uuse4iskusse4jbbbbe4lbkbbe4nusse4puuse51buke53bbke54kue59bbbbe5bsuue5ebbe5fuuue5rubue5ubue5wue61kuke63kuke64kbe6mke6vuuse71uube73ubbe7lubbe7rubbe7uube90qqdsse91bbdbe93dddde95bbse97buse99bbbse9bbbue9ebue9fbbue9gbue9jkuke9lkske9mkbe9rbbbbe9tbbue9wbue9xubuea2buea6buea8uea9usueacbbeaeueajkskealkskeamkbearssueasbbeaubbeawueayueb4keb9bbbbebbsuuebebbebfsuuebgbbebrkkuebsbkebubkebwuebyuecrkkuecsbkecubkecwuecyuedakedckedjsbuedlsbbedmbbedrbbbedsubeduubee4uee9ubbeecubeeiuueeuuef4uefauefcuefvuubeg1uuueg3usueglusbegrusuegubbegwuei1buuei3bubei4ubeirubueiubueiwuejmuelcu';
@@ -0,0 +1,86 @@
+// Solves every reachable tic-tac-toe position and writes js/moveTable.js.
+//
+//   node scripts/buildMoveTable.mjs
+//
+// Each record is a 3-char base-36 board code (see encodeBoard) followed by
+// one char per empty cell, in cell order, holding that move's minimax score
+// for the side to move ('k' = 0, 'u' = +10, 'a' = -10). After writing, the
+// engine's decoder is run on the table and checked against live minimax for
+// every position.
+import { writeFileSync } from 'node:fs';
+import { fileURLToPath } from 'node:url';
+import {
+  createBoard, getAvailableMoves, getGameResult, encodeBoard,
+} from '../js/gameEngine.js';
+import {
+  scoreMoves, searchBestMove, setMoveTable, lookupBestMove,
+} from '../js/aiEngine.js';
+
+const OUT = fileURLToPath(new URL('../js/moveTable.js', import.meta.url));
+
+function sideToMove(board) {
+  const filled = board.filter(cell => cell !== null).length;
+  return filled % 2 === 0 ? 'X' : 'O';
+}
+
+function collectPositions() {
+  const positions = new Map();
+  let reachable = 0;
+  const visit = (board) => {
+    const code = encodeBoard(board);
+    if (positions.has(code)) return;
+    positions.set(code, board);
+    reachable++;
+    if (getGameResult(board).status !== 'playing') return;
+    const player = sideToMove(board);
+    for (const move of getAvailableMoves(board)) {
+      const next = board.slice();
+      next[move] = player;
+      visit(next);
+    }
+  };
+  visit(createBoard());
+  const playable = [...positions.entries()]
+    .filter(([, board]) => getGameResult(board).status === 'playing')
+    .sort((a, b) => a[0] - b[0]);
+  return { reachable, playable };
+}
+
+function pack(playable) {
+  let out = '';
+  for (const [code, board] of playable) {
+    out += code.toString(36).padStart(3, '0');
+    const scores = scoreMoves(board.slice(), sideToMove(board));
+    for (let i = 0; i < 9; i++) {
+      if (board[i] === null) out += String.fromCharCode(107 + scores[i]);
+    }
+  }
+  return out;
+}
+
+const { reachable, playable } = collectPositions();
+const packed = pack(playable);
+
+writeFileSync(OUT,
+  '// Generated by scripts/buildMoveTable.mjs — do not edit by hand.\n'
+  + `export const MOVE_TABLE = '${packed}';\n`);
+
+// Check the engine's decoder and lookup against live minimax everywhere.
+setMoveTable(packed);
+let mismatches = 0;
+for (const [, board] of playable) {
+  const expected = searchBestMove(board.slice(), sideToMove(board));
+  const actual = lookupBestMove(board);
+  if (expected !== actual) {
+    mismatches++;
+    console.error(`mismatch on ${JSON.stringify(board)}: table ${actual}, minimax ${expected}`);
+  }
+}
+
+console.log(`${reachable} reachable positions, ${playable.length} solved, `
+  + `${packed.length} chars written to js/moveTable.js`);
+if (mismatches > 0) {
+  console.error(`${mismatches} positions disagree with live minimax`);
+  process.exit(1);
+}
+console.log('table matches live minimax on every position');